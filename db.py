@@ -0,0 +1,46 @@
+"""
+CONTEXT_FOR_LLM_INGESTION:
+--------------------------------------------------------------------------------
+SYSTEM ROLE:
+Shared SQLite Connection Helper.
+Hands out one long-lived connection per (thread, database) so the engine loops
+and CLI scripts stop reconnecting and re-running PRAGMA setup on every tick.
+
+DESIGN:
+- Connections are memoized per thread (threading.local). Each bot thread keeps
+  its own transaction scope; WAL mode + busy_timeout serialise the writers.
+- Do NOT close a connection returned by get_conn() - it is reused.
+--------------------------------------------------------------------------------
+"""
+
+import sqlite3
+import threading
+
+_local = threading.local()
+
+# Prepared statements kept per connection; hot queries must use constant SQL text to hit it
+STATEMENT_CACHE_SIZE = 200
+
+CONNECTION_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",      # 64 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped I/O
+    "PRAGMA busy_timeout=10000",     # Wait up to 10s for the write lock
+]
+
+
+def get_conn(db_path):
+    """Returns the calling thread's memoized connection to db_path, creating it on first use."""
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, timeout=10, cached_statements=STATEMENT_CACHE_SIZE)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conns[db_path] = conn
+    return conn
@@ -21,8 +21,18 @@ from eth_account import Account
 from hyperliquid.info import Info
 from hyperliquid.exchange import Exchange
 from hyperliquid.utils import constants
+from db import get_conn
 
 class HyperLiquidTopGun:
+    # szDecimals rarely change; refresh the cached universe metadata once a day
+    META_REFRESH_INTERVAL = 24 * 60 * 60
+
+    # Order IDs reset monthly on Hyperliquid; only match fills to signals this recent
+    ORDER_ID_WINDOW_DAYS = 30
+
+    # A TP fill younger than this can stand in for a user_state position check
+    FILL_PROOF_MAX_AGE_MS = 60 * 1000
+
     def __init__(self, bot_id, private_key, risk_per_trade=None, max_leverage=None, default_sl_dist=None, max_concurrent_positions=None, allowed_directions=None):
         self.bot_id = bot_id
         self.db_path = "/Users/johnny_main/Developer/data/signals/signals.db"
@@ -47,30 +57,56 @@ class HyperLiquidTopGun:
         # Direction filter: "both" (default), "long", or "short"
         self.allowed_directions = (allowed_directions or "both").lower()
 
+        # Breakeven SL after TP1 (read once; toggling requires a restart)
+        self.enable_breakeven = os.getenv('ENABLE_BREAKEVEN_SL', 'True').lower() == 'true'
+
         # --- CONNECTION & METADATA ---
         try:
             self.account = Account.from_key(private_key)
             is_mainnet = os.getenv("IS_MAINNET") == "True"
             node_url = constants.MAINNET_API_URL if is_mainnet else constants.TESTNET_API_URL
             
-            logging.info(f"[{self.bot_id}] Connecting... (Risk: {self.risk_per_trade*100}%, Max Lev: {self.max_leverage}x, Max Pos: {self.max_concurrent_positions}, Directions: {self.allowed_directions})")
+            logging.info(f"[{self.bot_id}] Connecting... (Risk: {self.risk_per_trade*100}%, Max Lev: {self.max_leverage}x, Max Pos: {self.max_concurrent_positions}, Directions: {self.allowed_directions}, Breakeven SL: {'ON' if self.enable_breakeven else 'OFF'})")
             
             self.info = Info(node_url, skip_ws=True)
             self.exchange = Exchange(self.account, node_url)
             
             # --- METADATA CACHE (CRITICAL FOR PRECISION) ---
-            self.meta = self.info.meta()
-            self.sz_decimals_map = {
-                asset['name']: asset['szDecimals'] 
-                for asset in self.meta['universe']
-            }
+            self._load_metadata()
             logging.info(f"[{self.bot_id}] Loaded precision data for {len(self.sz_decimals_map)} assets.")
+
+            # --- SCHEMA (before any loop thread touches the DB) ---
+            self._ensure_schema(get_conn(self.db_path))
             logging.info(f"[{self.bot_id}] Online. Wallet: {self.account.address[:6]}...")
             
         except Exception as e:
             logging.error(f"[{self.bot_id}] ❌ Init Failed: {e}")
             raise e
 
+    def _load_metadata(self):
+        """Fetches universe metadata once and caches szDecimals per asset."""
+        meta = self.info.meta()
+        self.sz_decimals_map = {
+            asset['name']: asset['szDecimals']
+            for asset in meta['universe']
+        }
+        self.meta = meta
+        self.meta_loaded_at = time.time()
+
+    def _refresh_metadata_if_stale(self):
+        """
+        Reloads the metadata cache once it is older than META_REFRESH_INTERVAL so
+        assets listed after startup become tradable. Keeps the old cache on failure.
+        """
+        if time.time() - self.meta_loaded_at < self.META_REFRESH_INTERVAL:
+            return
+        try:
+            self._load_metadata()
+            logging.info(f"[{self.bot_id}] Refreshed precision data for {len(self.sz_decimals_map)} assets.")
+        except Exception as e:
+            self.meta_loaded_at = time.time()  # Back off until the next interval
+            logging.warning(f"[{self.bot_id}] ⚠️ Metadata refresh failed, keeping cached data: {e}")
+
     def get_token_sz_decimals(self, ticker):
         """Returns the allowed SIZE decimals for a token (e.g. 3)."""
         return self.sz_decimals_map.get(ticker, 3)
@@ -95,10 +131,7 @@ class HyperLiquidTopGun:
             # The stricter of the two rules wins
             final_decimals = min(sig_figs_decimals, max_decimals)
             
-            # If allowed decimals < 0 (e.g. price must be 10, 20), round to integer
-            if final_decimals < 0:
-                 return round(price, final_decimals)
-                 
+            # Negative decimals (e.g. price must be 10, 20) round to tens/hundreds
             return round(price, final_decimals)
             
         except Exception:
@@ -160,9 +193,64 @@ class HyperLiquidTopGun:
         except (KeyError, IndexError, TypeError):
             return None
 
+    def _ensure_schema(self, conn):
+        """
+        Create the execution-layer indexes and the signal_tps child table (idempotent).
+
+        The composite indexes serve the bot_name/status and signal_type/status filters.
+        signal_tps holds one row per placed TP order (signal_id, tp_num, order_id,
+        target_price, filled_at) so a fill is matched with a single-column index seek
+        on order_id instead of a 5-way OR across order_id_tp1..5. The wide
+        order_id_tpN / tpN_filled_at columns stay the shared contract with the
+        ingestion layer and are still written alongside it. Existing TP orders are
+        backfilled from those columns on startup.
+        """
+        try:
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signals_tp_lookup ON signals(bot_name, status, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signals_type_status ON signals(signal_type, status, created_at)")
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS signal_tps (
+                    signal_id INTEGER NOT NULL,
+                    tp_num INTEGER NOT NULL,
+                    order_id INTEGER,
+                    target_price REAL,
+                    filled_at TEXT,
+                    PRIMARY KEY (signal_id, tp_num)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signal_tps_oid ON signal_tps(order_id)")
+
+            # Backfill (unpivot) TP orders placed before signal_tps existed
+            backfill = " UNION ALL ".join(
+                f"SELECT id, {n}, order_id_tp{n}, target_{n}, tp{n}_filled_at FROM signals WHERE order_id_tp{n} IS NOT NULL"
+                for n in range(1, 6)
+            )
+            conn.execute(f"INSERT OR IGNORE INTO signal_tps (signal_id, tp_num, order_id, target_price, filled_at) {backfill}")
+            conn.commit()
+        except sqlite3.Error as e:
+            # Fill matching reads signal_tps only, so running without it would
+            # silently never see a TP fill. Fail startup instead.
+            conn.rollback()
+            logging.error(f"[{self.bot_id}] ❌ Could not set up signal indexes / signal_tps: {e}")
+            raise
+
+    def _rollback_quietly(self, conn):
+        """
+        Roll back a failed tick on this thread's shared connection so the WAL
+        write lock isn't held through the sleep and half-applied writes aren't
+        committed by the next tick. A broken connection is left to the next get_conn.
+        """
+        if conn is None:
+            return
+        try:
+            conn.rollback()
+        except sqlite3.Error as e:
+            logging.warning(f"[{self.bot_id}] ⚠️ Rollback failed: {e}")
+
     def run_loop(self):
         logging.info(f"[{self.bot_id}] Starting Database Poll Loop...")
-        conn = sqlite3.connect(self.db_path)
+        conn = get_conn(self.db_path)
         
         while True:
             try:
@@ -254,6 +342,8 @@ class HyperLiquidTopGun:
                         # --- VALIDATION ---
                         if not entry: raise ValueError("Signal missing Entry Price")
 
+                        self._refresh_metadata_if_stale()
+
                         # Validate ticker exists on Hyperliquid
                         if ticker not in self.sz_decimals_map:
                             raise ValueError(f"Ticker '{ticker}' not available on Hyperliquid")
@@ -473,6 +563,14 @@ class HyperLiquidTopGun:
                             tp_oids.get(5),
                             signal_id
                         ))
+                        target_prices = dict(targets)
+                        c.executemany("""
+                            INSERT OR REPLACE INTO signal_tps (signal_id, tp_num, order_id, target_price)
+                            VALUES (?, ?, ?, ?)
+                        """, [
+                            (signal_id, tp_num, tp_oid, target_prices.get(tp_num))
+                            for tp_num, tp_oid in tp_oids.items() if tp_oid is not None
+                        ])
                         conn.commit()
                         if use_market_order:
                             logging.info(f"   ✅ Signal {signal_id} SUCCESS. Market order filled (status='filled').")
@@ -505,6 +603,7 @@ class HyperLiquidTopGun:
         last_fill_check = 0  # Timestamp of last processed fill
         full_scan_interval = 300  # 5 minutes - periodic full scan to catch missed fills
         last_full_scan = time.time()
+        conn = None
 
         while True:
             try:
@@ -514,14 +613,13 @@ class HyperLiquidTopGun:
                     last_fill_check = 0  # Reset to re-process all available fills
                     last_full_scan = time.time()
 
-                conn = sqlite3.connect(self.db_path, timeout=10)
+                conn = get_conn(self.db_path)
                 c = conn.cursor()
 
                 # Get all fills since last check
                 fills = self.info.user_fills(self.account.address)
 
                 if not fills:
-                    conn.close()
                     time.sleep(10)  # Check every 10 seconds
                     continue
 
@@ -532,24 +630,90 @@ class HyperLiquidTopGun:
                     # Update last check timestamp to most recent fill
                     last_fill_check = max(f['time'] for f in new_fills)
 
+                    # Prefetch every TP-matched signal for this batch in one query
+                    fill_oids = [f['oid'] for f in new_fills]
+                    tp_signals = self._prefetch_tp_signals(fill_oids, c)
+
                     # Process each fill
                     for fill in new_fills:
-                        self._process_fill(fill, c)
+                        if self._process_fill(fill, c, tp_signals):
+                            # An entry was upgraded to 'filled', so its TPs are now matchable
+                            tp_signals = self._prefetch_tp_signals(fill_oids, c)
 
                     conn.commit()
 
-                conn.close()
                 time.sleep(10)  # Check every 10 seconds
 
             except Exception as e:
                 logging.error(f"[{self.bot_id}] Fill Monitor Error: {e}")
+                self._rollback_quietly(conn)
                 time.sleep(10)
 
-    def _process_fill(self, fill, cursor):
+    def _order_id_cutoff(self):
+        """
+        Oldest created_at whose order IDs can still be trusted (Hyperliquid resets
+        order IDs monthly). Computed in Python and bound as a parameter so SQLite
+        compares the raw column against a constant and can use the created_at index.
+        Same UTC 'YYYY-MM-DD HH:MM:SS' format as SQLite's datetime('now').
+        """
+        from datetime import datetime, timedelta, timezone
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.ORDER_ID_WINDOW_DAYS)
+        return cutoff.strftime('%Y-%m-%d %H:%M:%S')
+
+    def _prefetch_tp_signals(self, oids, cursor):
+        """
+        Look up every 'filled' signal whose TP order IDs match any of the given fills.
+        Replaces one SELECT per fill with one SELECT per batch: a single-column
+        index seek on signal_tps.order_id (chunked to stay under SQLite's
+        bound-parameter limit).
+
+        Returns:
+            Dict of {oid: (tp_num, (id, direction, entry_1, order_id_sl, sl_moved_to_be, position_size_actual, num_targets))}
+        """
+        tp_signals = {}
+        oids = list(set(oids))
+        chunk_size = 900  # + bot_name and cutoff stays below the 999 parameter limit
+        placeholders = ", ".join("?" * chunk_size)
+        cutoff = self._order_id_cutoff()
+
+        for start in range(0, len(oids), chunk_size):
+            chunk = oids[start:start + chunk_size]
+            # Pad with a repeated oid so the SQL text is identical on every call
+            # and the connection's statement cache can reuse the prepared query
+            chunk += [chunk[0]] * (chunk_size - len(chunk))
+            # IMPORTANT: Order IDs reset monthly on Hyperliquid, so filter by time to avoid collisions
+            cursor.execute(f"""
+                SELECT s.id, s.direction, s.entry_1, s.order_id_sl, s.sl_moved_to_be, s.position_size_actual,
+                    CASE WHEN s.target_1 IS NOT NULL THEN 1 ELSE 0 END +
+                    CASE WHEN s.target_2 IS NOT NULL THEN 1 ELSE 0 END +
+                    CASE WHEN s.target_3 IS NOT NULL THEN 1 ELSE 0 END +
+                    CASE WHEN s.target_4 IS NOT NULL THEN 1 ELSE 0 END +
+                    CASE WHEN s.target_5 IS NOT NULL THEN 1 ELSE 0 END as num_targets,
+                    t.tp_num, t.order_id
+                FROM signal_tps t
+                JOIN signals s ON s.id = t.signal_id
+                WHERE t.order_id IN ({placeholders})
+                AND s.bot_name = ?
+                AND s.status = 'filled'
+                AND s.created_at > ?
+            """, (*chunk, self.bot_id, cutoff))
+
+            for row in cursor.fetchall():
+                signal_row, tp_num, tp_oid = row[:7], row[7], row[8]
+                tp_signals.setdefault(tp_oid, (tp_num, signal_row))
+
+        return tp_signals
+
+    def _process_fill(self, fill, cursor, tp_signals):
         """
         Process a single fill and trigger breakeven logic if TP1 hit.
         Also tracks position closures and calculates actual PnL.
 
+        tp_signals is the batch lookup built by _prefetch_tp_signals().
+        Returns True if an entry fill upgraded a signal 'sent' → 'filled',
+        so the caller can refresh its TP lookup.
+
         Fill structure:
         {
             'coin': 'ETH',
@@ -572,6 +736,8 @@ class HyperLiquidTopGun:
         # Debug logging for fill processing
         logging.debug(f"[{self.bot_id}] Processing fill: {ticker} | OID={oid} | Dir={fill_dir} | Time={fill_time}")
 
+        entry_upgraded = False
+
         # DETECT ENTRY FILLS: Upgrade 'sent' → 'filled' when limit order fills
         if 'Open' in fill_dir:
             cursor.execute("""
@@ -579,8 +745,8 @@ class HyperLiquidTopGun:
                 WHERE bot_name = ?
                 AND order_id_entry = ?
                 AND status = 'sent'
-                AND datetime(created_at) > datetime('now', '-30 days')
-            """, (self.bot_id, oid))
+                AND created_at > ?
+            """, (self.bot_id, oid, self._order_id_cutoff()))
             sent_row = cursor.fetchone()
             if sent_row:
                 sent_signal_id = sent_row[0]
@@ -591,70 +757,66 @@ class HyperLiquidTopGun:
                     WHERE id = ?
                 """, (fill_time, sent_signal_id))
                 cursor.connection.commit()
+                entry_upgraded = True
                 logging.info(f"[{self.bot_id}] ✅ ENTRY FILL DETECTED: {ticker} (Signal {sent_signal_id}) → status='filled'")
 
         # TRACK POSITION CLOSURES for actual PnL calculation
         if 'Close' in fill_dir and closed_pnl != 0.0:
             self._track_position_closure(ticker, fill, cursor)
 
-        # Find signal associated with this order ID
-        # IMPORTANT: Order IDs reset monthly on Hyperliquid, so filter by time to avoid collisions
-        cursor.execute("""
-            SELECT id, direction, entry_1, order_id_sl, sl_moved_to_be, position_size_actual
-            FROM signals
-            WHERE bot_name = ?
-            AND (
-                order_id_tp1 = ? OR
-                order_id_tp2 = ? OR
-                order_id_tp3 = ? OR
-                order_id_tp4 = ? OR
-                order_id_tp5 = ?
-            )
-            AND status = 'filled'
-            AND datetime(created_at) > datetime('now', '-30 days')
-        """, (self.bot_id, oid, oid, oid, oid, oid))
-
-        row = cursor.fetchone()
+        # Find signal associated with this order ID (prefetched for the whole batch)
+        match = tp_signals.get(oid)
 
-        if not row:
+        if not match:
             logging.debug(f"[{self.bot_id}] No signal match for fill: {ticker} OID={oid}")
-            return  # Fill not related to any active position
+            return entry_upgraded  # Fill not related to any active position
 
-        signal_id, direction, entry_price, sl_oid, sl_moved_to_be, position_size = row
-
-        # Check which TP was filled
-        cursor.execute("""
-            SELECT
-                CASE
-                    WHEN order_id_tp1 = ? THEN 1
-                    WHEN order_id_tp2 = ? THEN 2
-                    WHEN order_id_tp3 = ? THEN 3
-                    WHEN order_id_tp4 = ? THEN 4
-                    WHEN order_id_tp5 = ? THEN 5
-                END as tp_num
-            FROM signals WHERE id = ?
-        """, (oid, oid, oid, oid, oid, signal_id))
-
-        tp_num = cursor.fetchone()[0]
+        tp_num, (signal_id, direction, entry_price, sl_oid, sl_moved_to_be, position_size, num_targets) = match
 
         logging.info(f"[{self.bot_id}] 🎯 TP{tp_num} FILLED: {ticker} | Signal {signal_id}")
 
-        # Update fill timestamp
-        cursor.execute(f"""
+        # Update fill timestamp (constant SQL text so the statement cache can reuse it)
+        cursor.execute("""
             UPDATE signals
-            SET tp{tp_num}_filled_at = ?
-            WHERE id = ?
-        """, (fill_time, signal_id))
+            SET tp1_filled_at = CASE WHEN :tp_num = 1 THEN :fill_time ELSE tp1_filled_at END,
+                tp2_filled_at = CASE WHEN :tp_num = 2 THEN :fill_time ELSE tp2_filled_at END,
+                tp3_filled_at = CASE WHEN :tp_num = 3 THEN :fill_time ELSE tp3_filled_at END,
+                tp4_filled_at = CASE WHEN :tp_num = 4 THEN :fill_time ELSE tp4_filled_at END,
+                tp5_filled_at = CASE WHEN :tp_num = 5 THEN :fill_time ELSE tp5_filled_at END
+            WHERE id = :signal_id
+        """, {"tp_num": tp_num, "fill_time": fill_time, "signal_id": signal_id})
+        cursor.execute("""
+            UPDATE signal_tps SET filled_at = ? WHERE signal_id = ? AND tp_num = ?
+        """, (fill_time, signal_id, tp_num))
 
         # TRIGGER BREAKEVEN LOGIC IF TP1 HIT
-        enable_breakeven = os.getenv('ENABLE_BREAKEVEN_SL', 'True').lower() == 'true'
-        if tp_num == 1 and not sl_moved_to_be and enable_breakeven:
+        if self.enable_breakeven and tp_num == 1 and not sl_moved_to_be:
             logging.info(f"[{self.bot_id}] 🔄 TRIGGERING BREAKEVEN for Signal {signal_id}")
-            self._move_sl_to_breakeven(signal_id, ticker, direction, entry_price, sl_oid, position_size, cursor)
+            self._move_sl_to_breakeven(signal_id, ticker, direction, entry_price, sl_oid, position_size, num_targets, cursor,
+                                       position_open=self._fill_proves_position_open(fill))
 
-    def _move_sl_to_breakeven(self, signal_id, ticker, direction, entry_price, old_sl_oid, position_size, cursor):
+        return entry_upgraded
+
+    def _fill_proves_position_open(self, fill):
+        """
+        True if a fresh TP fill left size on the position (startPosition - sz > 0).
+        Old fills replayed by the periodic full scan prove nothing about the
+        current position, so only fills from the last FILL_PROOF_MAX_AGE_MS count.
+        """
+        if 'startPosition' not in fill:
+            return False
+        if time.time() * 1000 - fill['time'] > self.FILL_PROOF_MAX_AGE_MS:
+            return False
+        remaining = abs(float(fill['startPosition'])) - float(fill['sz'])
+        return round(remaining, self.get_token_sz_decimals(fill['coin'])) > 0
+
+    def _move_sl_to_breakeven(self, signal_id, ticker, direction, entry_price, old_sl_oid, position_size, num_targets, cursor, position_open=False):
         """
         Cancel existing stop loss and place new one at breakeven (entry price).
+        num_targets is the count of non-null target_N columns, selected by the caller
+        alongside the signal row so no extra lookup is needed here.
+        position_open=True means the caller already proved the position is live
+        (see _fill_proves_position_open), so the user_state round-trip is skipped.
 
         Thread Safety: Uses atomic claim pattern to prevent race conditions between
         Fill Monitor and Position Reconciliation threads.
@@ -680,27 +842,16 @@ class HyperLiquidTopGun:
             is_long = direction.lower() in ['long', 'bullish']
 
             # Check if position still exists before modifying SL
-            user_state = self.info.user_state(self.account.address)
-            positions = user_state.get("assetPositions", [])
-            active_position = next((p for p in positions if p["position"]["coin"] == ticker), None)
+            if not position_open:
+                user_state = self.info.user_state(self.account.address)
+                positions = user_state.get("assetPositions", [])
+                active_position = next((p for p in positions if p["position"]["coin"] == ticker), None)
 
-            if not active_position or float(active_position["position"]["szi"]) == 0:
-                logging.warning(f"   ⚠️ Position already closed for {ticker}, skipping breakeven")
-                return
+                if not active_position or float(active_position["position"]["szi"]) == 0:
+                    logging.warning(f"   ⚠️ Position already closed for {ticker}, skipping breakeven")
+                    return
 
             # Calculate remaining position size after TP1 (75% if 4 TPs)
-            # Query how many TPs exist for this signal
-            cursor.execute("""
-                SELECT
-                    CASE WHEN target_1 IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN target_2 IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN target_3 IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN target_4 IS NOT NULL THEN 1 ELSE 0 END +
-                    CASE WHEN target_5 IS NOT NULL THEN 1 ELSE 0 END as num_targets
-                FROM signals WHERE id = ?
-            """, (signal_id,))
-
-            num_targets = cursor.fetchone()[0]
             remaining_size = position_size * (num_targets - 1) / num_targets
             sz_decimals = self.get_token_sz_decimals(ticker)
             remaining_size = round(remaining_size, sz_decimals)
@@ -860,10 +1011,11 @@ class HyperLiquidTopGun:
         - Manual position closes on Hyperliquid
         """
         logging.info(f"[{self.bot_id}] Starting Position Reconciliation Loop...")
+        conn = None
 
         while True:
             try:
-                conn = sqlite3.connect(self.db_path, timeout=10)
+                conn = get_conn(self.db_path)
                 c = conn.cursor()
 
                 # Get all positions DB thinks are open (status='filled' or 'sent')
@@ -879,7 +1031,6 @@ class HyperLiquidTopGun:
                 db_positions = c.fetchall()
 
                 if not db_positions:
-                    conn.close()
                     time.sleep(60)
                     continue
 
@@ -976,12 +1127,12 @@ class HyperLiquidTopGun:
                 self._cleanup_stale_orders(c)
 
                 conn.commit()
-                conn.close()
 
                 time.sleep(60)  # Run every 60 seconds
 
             except Exception as e:
                 logging.error(f"[{self.bot_id}] Position Reconciliation Error: {e}")
+                self._rollback_quietly(conn)
                 time.sleep(60)
 
     def _get_pnl_from_fills(self, ticker, entry_price, position_size):
@@ -1030,13 +1181,17 @@ class HyperLiquidTopGun:
 
         Called from run_position_reconciliation() every 60 seconds.
         """
-        enable_breakeven = os.getenv('ENABLE_BREAKEVEN_SL', 'True').lower() == 'true'
-        if not enable_breakeven:
+        if not self.enable_breakeven:
             return
 
         # Query positions with status='filled' and sl_moved_to_be=0 (BE not yet triggered)
         cursor.execute("""
-            SELECT id, symbol, direction, entry_1, order_id_tp1, order_id_sl, position_size_actual
+            SELECT id, symbol, direction, entry_1, order_id_tp1, order_id_sl, position_size_actual,
+                CASE WHEN target_1 IS NOT NULL THEN 1 ELSE 0 END +
+                CASE WHEN target_2 IS NOT NULL THEN 1 ELSE 0 END +
+                CASE WHEN target_3 IS NOT NULL THEN 1 ELSE 0 END +
+                CASE WHEN target_4 IS NOT NULL THEN 1 ELSE 0 END +
+                CASE WHEN target_5 IS NOT NULL THEN 1 ELSE 0 END as num_targets
             FROM signals
             WHERE bot_name = ?
             AND status = 'filled'
@@ -1061,7 +1216,7 @@ class HyperLiquidTopGun:
 
         # Check each position for missed TP1 fill
         for row in positions_without_be:
-            signal_id, ticker, direction, entry_price, tp1_oid, sl_oid, position_size = row
+            signal_id, ticker, direction, entry_price, tp1_oid, sl_oid, position_size, num_targets = row
 
             # Check if TP1 order was filled but we missed detecting it
             if tp1_oid and tp1_oid in fill_oids:
@@ -1071,7 +1226,7 @@ class HyperLiquidTopGun:
                 try:
                     self._move_sl_to_breakeven(
                         signal_id, ticker, direction, entry_price,
-                        sl_oid, position_size, cursor
+                        sl_oid, position_size, num_targets, cursor
                     )
                 except Exception as e:
                     logging.error(f"[{self.bot_id}] ❌ Fallback breakeven failed for {ticker} (Signal {signal_id}): {e}")
@@ -5,8 +5,8 @@ SYSTEM ROLE:
 Emergency Kill Switch (Direct API Connection).
 This script bypasses the database and the bot loop to directly:
 1. Fetch ALL open orders (Limit, Stop, TP/SL).
-2. Cancel them one by one using their specific Order ID (oid).
-3. Market Close ALL open positions.
+2. Cancel them in a single bulk_cancel request using their Order IDs (oid).
+3. Market Close ALL open positions in a single bulk_orders request (failed closes retried serially).
 
 USAGE:
 python nuke_account.py "Apprentice Alchemist"  -> Nuke specific bot
@@ -16,7 +16,9 @@ python nuke_account.py ALL                     -> Nuke ALL bots (Emergency)
 
 import sys
 import os
+import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv, find_dotenv
 from eth_account import Account
 from hyperliquid.info import Info
@@ -35,12 +37,43 @@ FLEET_KEYS = {
 
 IS_MAINNET = os.getenv("IS_MAINNET") == "True"
 BASE_URL = constants.MAINNET_API_URL if IS_MAINNET else constants.TESTNET_API_URL
+CLOSE_SLIPPAGE = 0.05  # Same aggressive IOC price market_close uses
 
-def nuke_wallet(bot_name, private_key):
-    print(f"\n☢️  INITIATING NUKE PROTOCOL FOR: {bot_name}")
+
+def close_px(mid, is_buy, sz_decimals):
+    """
+    IOC limit price for a market close: the mid moved CLOSE_SLIPPAGE through the book,
+    rounded like HyperLiquidTopGun.round_px (max 5 significant figures, max 6 - szDecimals decimals).
+    """
+    px = mid * (1 + CLOSE_SLIPPAGE) if is_buy else mid * (1 - CLOSE_SLIPPAGE)
+    decimals = min(5 - 1 - math.floor(math.log10(px)), 6 - sz_decimals)
+    return round(px, decimals)
+
+
+def action_errors(result, count):
+    """
+    Per-request error (or None) from a signed action's response. The SDK does not raise
+    when the exchange rejects an action: it returns {"status": "err"} for the whole action,
+    or an {"error": ...} entry in response.data.statuses per order.
+    """
+    if not isinstance(result, dict) or result.get("status") != "ok":
+        reason = result.get("response") if isinstance(result, dict) else result
+        return [f"API Error: {reason}"] * count
+    response = result.get("response")
+    statuses = response.get("data", {}).get("statuses", []) if isinstance(response, dict) else []
+    errors = [s["error"] if isinstance(s, dict) and "error" in s else None for s in statuses]
+    return errors + ["No status returned"] * (count - len(errors))
+
+def nuke_wallet(bot_name, private_key, log=print):
+    """
+    Cancels every open order and market-closes every position for one wallet.
+    Output goes through `log` (print by default) so fleet-wide runs can buffer
+    each wallet's report and print it in one block.
+    """
+    log(f"\n☢️  INITIATING NUKE PROTOCOL FOR: {bot_name}")
     
     if not private_key:
-        print(f"   ❌ Error: No private key found for {bot_name}")
+        log(f"   ❌ Error: No private key found for {bot_name}")
         return
 
     try:
@@ -48,34 +81,35 @@ def nuke_wallet(bot_name, private_key):
         account = Account.from_key(private_key)
         info = Info(BASE_URL, skip_ws=True)
         exchange = Exchange(account, BASE_URL)
-        print(f"   🔑 Wallet: {account.address}")
+        log(f"   🔑 Wallet: {account.address}")
 
         # 2. Cancel All Orders
-        print("   🗑  Scanning for open orders...")
+        log("   🗑  Scanning for open orders...")
         try:
             open_orders = info.frontend_open_orders(account.address)
             
             if not open_orders:
-                print("      ✅ No open orders found.")
+                log("      ✅ No open orders found.")
             else:
-                print(f"      👀 Found {len(open_orders)} active orders. Cancelling now...")
-                for order in open_orders:
+                log(f"      👀 Found {len(open_orders)} active orders. Cancelling now...")
+                # One signed request cancels every order (requires coin and oid per order)
+                result = exchange.bulk_cancel([{"coin": o["coin"], "oid": o["oid"]} for o in open_orders])
+
+                for order, error in zip(open_orders, action_errors(result, len(open_orders))):
                     ticker = order["coin"]
                     oid = order["oid"]
                     type_str = order.get("orderType", "Order")
-                    
-                    try:
-                        # The Hyperliquid SDK cancel method requires coin and oid
-                        result = exchange.cancel(ticker, oid)
-                        print(f"      ❌ Cancelled {ticker} {type_str} (ID: {oid})")
-                    except Exception as e:
-                        print(f"      ⚠️ Failed to cancel {ticker} (ID: {oid}): {e}")
+
+                    if error:
+                        log(f"      ⚠️ Failed to cancel {ticker} (ID: {oid}): {error}")
+                    else:
+                        log(f"      ❌ Cancelled {ticker} {type_str} (ID: {oid})")
                         
         except Exception as e:
-            print(f"      ❌ Error fetching/cancelling orders: {e}")
+            log(f"      ❌ Error fetching/cancelling orders: {e}")
 
         # 3. Close All Positions
-        print("   📉 Closing all positions...")
+        log("   📉 Closing all positions...")
         try:
             user_state = info.user_state(account.address)
             positions = user_state.get("assetPositions", [])
@@ -83,24 +117,57 @@ def nuke_wallet(bot_name, private_key):
             active_positions = [p for p in positions if float(p["position"]["szi"]) != 0]
             
             if not active_positions:
-                print("      ✅ No positions to close.")
+                log("      ✅ No positions to close.")
             else:
+                coins = [p["position"]["coin"] for p in active_positions]
                 for p in active_positions:
-                    coin = p["position"]["coin"]
-                    sz = float(p["position"]["szi"])
-                    print(f"      💥 Closing {coin} (Size: {sz})...")
-                    
+                    log(f"      💥 Closing {p['position']['coin']} (Size: {float(p['position']['szi'])})...")
+
+                # Market Close every position in one signed action: a reduce-only IOC order per
+                # coin priced from one mids fetch (same slippage market_close would use)
+                try:
+                    sz_decimals = {a["name"]: a["szDecimals"] for a in info.meta()["universe"]}
+                    mids = info.all_mids()
+                    close_orders = []
+                    for p in active_positions:
+                        coin = p["position"]["coin"]
+                        szi = float(p["position"]["szi"])
+                        is_buy = szi < 0
+                        close_orders.append({
+                            "coin": coin,
+                            "is_buy": is_buy,
+                            "sz": abs(szi),
+                            "limit_px": close_px(float(mids[coin]), is_buy, sz_decimals.get(coin, 3)),
+                            "order_type": {"limit": {"tif": "Ioc"}},
+                            "reduce_only": True,
+                        })
+                    errors = action_errors(exchange.bulk_orders(close_orders), len(coins))
+                except Exception as e:
+                    errors = [str(e)] * len(coins)
+
+                # Anything the bulk action didn't close is retried on its own with market_close;
+                # only the final outcome per coin is reported
+                for coin, bulk_error in zip(coins, errors):
+                    if not bulk_error:
+                        log(f"         ✅ Closed {coin}.")
+                        continue
                     try:
-                        # Market Close
-                        exchange.market_close(coin)
-                        print(f"         ✅ Closed {coin}.")
+                        result = exchange.market_close(coin)
+                        if result is None:
+                            log(f"         ✅ {coin} already closed.")  # No position left to close
+                            continue
+                        error = action_errors(result, 1)[0]
+                        if error:
+                            log(f"         ❌ Failed to close {coin}: {error} (bulk close: {bulk_error})")
+                        else:
+                            log(f"         ✅ Closed {coin} (retry).")
                     except Exception as e:
-                        print(f"         ❌ Failed to close {coin}: {e}")
+                        log(f"         ❌ Failed to close {coin}: {e} (bulk close: {bulk_error})")
         except Exception as e:
-            print(f"      ❌ Error fetching positions: {e}")
+            log(f"      ❌ Error fetching positions: {e}")
 
     except Exception as e:
-        print(f"   ❌ CRITICAL ERROR: {e}")
+        log(f"   ❌ CRITICAL ERROR: {e}")
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -116,8 +183,17 @@ if __name__ == "__main__":
         print("You have 5 seconds to cancel (Ctrl+C)...")
         time.sleep(5)
         
-        for name, key in FLEET_KEYS.items():
-            nuke_wallet(name, key)
+        # Wallets are independent, so nuke them all at once; each report is buffered
+        # and printed in fleet order so the output doesn't interleave
+        def nuke_buffered(item):
+            name, key = item
+            lines = []
+            nuke_wallet(name, key, log=lines.append)
+            return lines
+
+        with ThreadPoolExecutor(max_workers=len(FLEET_KEYS)) as pool:
+            for lines in pool.map(nuke_buffered, FLEET_KEYS.items()):
+                print("\n".join(lines))
             
     else:
         # Check if name exists
@@ -6,15 +6,17 @@ Database Reset Utility ("The Nuke").
 DANGER: This script permanently deletes all records from 'signals.db'.
 
 UPDATES (Fix for VACUUM Error):
-- Added explicit `conn.commit()` after DELETE operations.
-- Sets `conn.isolation_level = None` (Auto-Commit) before running VACUUM.
+- All DELETEs (signals, signal_tps, bot_controls) run in one explicit BEGIN IMMEDIATE ... COMMIT transaction.
+- Sets `conn.isolation_level = None` (Auto-Commit) so VACUUM can run, and restores it
+  afterwards because the connection is the shared get_conn() one.
+- Skips VACUUM when the signals table was already empty.
 --------------------------------------------------------------------------------
 """
 
-import sqlite3
 import os
 import glob
 from colorama import Fore, Style, init
+from db import get_conn
 
 init(autoreset=True)
 
@@ -35,7 +37,7 @@ def nuke_system():
 
     # 1. CLEAN DATABASE
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_conn(DB_PATH)
         c = conn.cursor()
         
         # Count rows before death
@@ -46,19 +48,33 @@ def nuke_system():
             count = 0
         
         # Execute Order 66
+        # Unqualified DELETEs hit SQLite's truncate optimization (O(1) per table).
+        # They all run in one explicit transaction so there is a single commit/fsync.
         print(f"{Fore.YELLOW}   ... Deleting records...")
-        c.execute("DELETE FROM signals")
-        c.execute("DELETE FROM bot_controls")
-        
-        # CRITICAL FIX: Commit the deletions to end the transaction
         conn.commit()
+        saved_isolation = conn.isolation_level
+        conn.isolation_level = None  # Auto-Commit: we manage the transaction (and VACUUM needs it)
+        try:
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                c.execute("DELETE FROM signals")
+                # signal_tps only exists once a bot has started against this DB
+                c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='signal_tps'")
+                if c.fetchone():
+                    c.execute("DELETE FROM signal_tps")
+                c.execute("DELETE FROM bot_controls")
+                c.execute("COMMIT")
+            except Exception:
+                c.execute("ROLLBACK")
+                raise
+
+            # Nothing was deleted, so there is no free space to reclaim
+            if count > 0:
+                print(f"{Fore.YELLOW}   ... Vacuuming database (Reclaiming space)...")
+                conn.execute("VACUUM")
+        finally:
+            conn.isolation_level = saved_isolation  # get_conn() hands this connection to later callers
         
-        # CRITICAL FIX: Set isolation_level to None (Auto-Commit) to run VACUUM
-        conn.isolation_level = None
-        print(f"{Fore.YELLOW}   ... Vacuuming database (Reclaiming space)...")
-        conn.execute("VACUUM")
-        
-        conn.close()
         print(f"\n{Fore.GREEN}✅ Database vaporized. ({count} rows deleted)")
         
     except Exception as e:
@@ -12,10 +12,11 @@ UPDATES (Fix for NoneType Error):
 --------------------------------------------------------------------------------
 """
 
-import sqlite3
+import os
 import pandas as pd
 import re
 from colorama import Fore, Style, init
+from db import get_conn
 
 # Initialize colorama
 init(autoreset=True)
@@ -25,86 +26,157 @@ DB_PATH = "/Users/johnny_main/Developer/data/signals/signals.db"
 # Suppress pandas future warnings
 pd.set_option('future.no_silent_downcasting', True)
 
-def extract_pnl_from_notes(row):
+# Exit rows fetched per query when filling the snapshot cache (SQLite allows 999 bound params)
+FETCH_CHUNK_SIZE = 900
+
+# Snapshot of already-processed executed exits, stored next to the database
+CACHE_FILENAME = "pnl_dashboard_cache.csv"
+
+# "Return: -2.5%" pattern in notes (fallback PnL source)
+PNL_NOTES_RE = re.compile(r'Return:\s*([-\d.]+)%')
+
+def extract_pnl_from_notes(df):
     """
-    Fallback Logic:
+    Fallback Logic (vectorized over the whole frame):
     1. Use the explicit 'pnl_percent' column if valid (not 0.0).
     2. Else, scan 'notes' for "Return: -2.5%" text pattern.
     3. Else, return 0.0.
+    Expects 'pnl_percent' to be numeric already.
     """
-    # Robust check: Ensure value is a float and not effectively zero
-    val = row['pnl_percent']
+    use_col = df['pnl_percent'].abs() > 0.001
+
+    # Regex fallback (unparseable captures such as "-" or "." coerce to 0.0)
+    extracted = df['notes'].astype(str).str.extract(PNL_NOTES_RE, expand=False)
+    extracted = pd.to_numeric(extracted, errors='coerce').fillna(0.0)
+
+    return df['pnl_percent'].where(use_col, extracted).astype(float)
+
+def clean_exit_chunk(chunk):
+    """Applies the PnL data hygiene to raw exit rows and keeps only the cached columns."""
+    # --- DATA HYGIENE (CRITICAL FIX) ---
+    # 1. Force PnL to numeric (coerces strings/None to NaN, then fills with 0.0)
+    #    (no read dtype for this column: legacy rows can hold text)
+    chunk['pnl_percent'] = pd.to_numeric(chunk['pnl_percent'], errors='coerce').fillna(0.0)
+
+    # 2. Force Bot Name to string (handles NULLs)
+    chunk['bot_name'] = chunk['bot_name'].fillna("Unknown Bot")
+
+    # 3. Calculate Real PnL using the helper
+    chunk['real_pnl'] = extract_pnl_from_notes(chunk)
+    return chunk[['id', 'created_at', 'bot_name', 'real_pnl']]
+
+def load_exit_pnl(conn):
+    """
+    Returns (id, created_at, bot_name, real_pnl) for every executed exit.
+
+    Executed exits are terminal, so their derived PnL is snapshotted to a CSV
+    next to the database. Each run only lists (id, created_at) from SQLite
+    (covered by the signal_type/status index) and fetches full rows for exits
+    missing from the snapshot. Rows are matched on id AND created_at so a
+    nuked/reset database never reuses stale cached rows.
+    """
+    cache_path = os.path.join(os.path.dirname(DB_PATH), CACHE_FILENAME)
+
+    current = pd.read_sql_query("""
+        SELECT id, created_at
+        FROM signals
+        WHERE signal_type = 'exit' AND status = 'executed'
+    """, conn)
+
+    cached = None
     try:
-        if isinstance(val, (int, float)) and abs(val) > 0.001:
-            return float(val)
-    except:
-        pass
-
-    # Regex fallback
-    match = re.search(r'Return:\s*([-\d.]+)%', str(row['notes']))
-    if match:
+        snapshot = pd.read_csv(cache_path, dtype={'created_at': object, 'bot_name': object})
+        cached = snapshot.merge(current, on=['id', 'created_at'], how='inner')
+    except (OSError, ValueError, KeyError):
+        pass  # Missing or unreadable snapshot: rebuild it from SQLite
+
+    # Snapshot rows that no longer match the database (status change / reset DB)
+    stale = cached is None or len(cached) != len(snapshot)
+
+    known_ids = set(cached['id']) if cached is not None else set()
+    missing_ids = [int(i) for i in current['id'] if i not in known_ids]
+
+    frames = [cached] if cached is not None else []
+    for start in range(0, len(missing_ids), FETCH_CHUNK_SIZE):
+        chunk_ids = missing_ids[start:start + FETCH_CHUNK_SIZE]
+        placeholders = ", ".join("?" * len(chunk_ids))
+        chunk = pd.read_sql_query(f"""
+            SELECT id, created_at, bot_name, pnl_percent, notes
+            FROM signals
+            WHERE id IN ({placeholders})
+        """, conn, params=chunk_ids)
+        frames.append(clean_exit_chunk(chunk))
+
+    if frames:
+        exits = pd.concat(frames, ignore_index=True)
+    else:
+        exits = pd.DataFrame({
+            'id': pd.Series(dtype='int64'),
+            'created_at': pd.Series(dtype=object),
+            'bot_name': pd.Series(dtype=object),
+            'real_pnl': pd.Series(dtype='float64'),
+        })
+
+    # Rewrite the snapshot when rows were added or dropped
+    if stale or missing_ids:
         try:
-            return float(match.group(1))
-        except:
-            return 0.0
-            
-    return 0.0
+            exits.to_csv(cache_path, index=False)
+        except OSError as e:
+            print(f"{Fore.YELLOW}⚠️  Could not write dashboard cache ({e}); continuing without it.")
+
+    return exits
 
 def get_pnl_report():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn(DB_PATH)
 
     # 1. FETCH DATA
-    query = """
-        SELECT id, bot_name, symbol, signal_type, status, 
-               entry_1, position_size_actual, pnl_percent, created_at, notes 
-        FROM signals 
-        ORDER BY created_at ASC
-    """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
+    # Every bot gets a row in the report, in order of its first signal
+    bots_df = pd.read_sql_query("""
+        SELECT bot_name
+        FROM signals
+        GROUP BY bot_name
+        ORDER BY MIN(created_at) ASC, MIN(id) ASC
+    """, conn)
 
-    if df.empty:
+    if bots_df.empty:
         print(f"{Fore.RED}❌ Database is empty.")
         return
 
-    # --- DATA HYGIENE (CRITICAL FIX) ---
-    # 1. Force PnL to numeric (coerces strings/None to NaN, then fills with 0.0)
-    df['pnl_percent'] = pd.to_numeric(df['pnl_percent'], errors='coerce').fillna(0.0)
-    
-    # 2. Force Bot Name to string (handles NULLs)
-    df['bot_name'] = df['bot_name'].fillna("Unknown Bot")
+    # Only executed exits feed the performance table (served from the snapshot cache + delta)
+    exits = load_exit_pnl(conn)
 
-    # 3. Calculate Real PnL using the helper
-    df['real_pnl'] = df.apply(extract_pnl_from_notes, axis=1)
-
-    # 4. Separate Dataframes
-    entries = df[(df['signal_type'] == 'entry') & (df['status'] == 'filled')].copy()
-    exits = df[(df['signal_type'] == 'exit') & (df['status'] == 'executed')].copy()
+    # Few distinct bots: categorical groupby is cheaper than object-dtype groupby
+    exits['bot_name'] = exits['bot_name'].astype('category')
 
     # --- SECTION A: PERFORMANCE TABLE ---
     print(f"\n{Style.BRIGHT}{Fore.CYAN}📊 HYPERLIQUID FLEET REPORT")
     print("=" * 70)
     
-    bots = df['bot_name'].unique()
+    bots = bots_df['bot_name'].fillna("Unknown Bot").unique()
     
     total_wins = 0
     total_trades = 0
+
+    # One grouped pass over exits instead of re-masking the frame per bot
+    exit_stats = exits.assign(is_win=exits['real_pnl'] > 0).groupby('bot_name', observed=True).agg(
+        count=('real_pnl', 'size'),
+        wins=('is_win', 'sum'),
+        avg_pnl=('real_pnl', 'mean'),
+    )
     
     print(f"{Style.BRIGHT}{'BOT NAME':<25} | {'TRADES':<6} | {'WIN RATE':<9} | {'AVG PNL':<9}")
     print("-" * 70)
 
     for bot in bots:
-        # Filter exits for this bot
-        bot_exits = exits[exits['bot_name'] == bot]
-        count = len(bot_exits)
+        count = int(exit_stats.at[bot, 'count']) if bot in exit_stats.index else 0
         
         if count > 0:
             # Stats Calculation
-            wins = bot_exits[bot_exits['real_pnl'] > 0]
-            win_rate = (len(wins) / count) * 100
+            wins = int(exit_stats.at[bot, 'wins'])
+            win_rate = (wins / count) * 100
             
             # fillna(0.0) ensures we never format a NoneType
-            avg_pnl = bot_exits['real_pnl'].mean()
+            avg_pnl = exit_stats.at[bot, 'avg_pnl']
             if pd.isna(avg_pnl): avg_pnl = 0.0
             
             # Formatting Colors
@@ -113,7 +185,7 @@ def get_pnl_report():
             
             print(f"{Fore.WHITE}{bot:<25} | {count:<6} | {wr_color}{win_rate:>6.1f}%{Fore.RESET}  | {pnl_color}{avg_pnl:>6.2f}%")
             
-            total_wins += len(wins)
+            total_wins += wins
             total_trades += count
         else:
             # Empty row
@@ -133,32 +205,57 @@ def get_pnl_report():
     print(f"{'BOT':<20} | {'SYMBOL':<8} | {'ENTRY':<10} | {'SIZE':<10} | {'TIME (UTC)'}")
     print("-" * 70)
     
-    active_found = False
-    
-    for bot in bots:
-        bot_entries = entries[entries['bot_name'] == bot]
-        bot_exits = exits[exits['bot_name'] == bot]
-        
-        symbols = bot_entries['symbol'].unique()
+    # Netting in SQL: Buys - Sells = Open Positions per (bot, symbol), then keep
+    # the N most recent filled entries of each group via ROW_NUMBER()
+    active_query = """
+        WITH filled_entries AS (
+            SELECT id, COALESCE(bot_name, 'Unknown Bot') AS bot_name, symbol,
+                   entry_1, position_size_actual, created_at
+            FROM signals
+            WHERE signal_type = 'entry' AND status = 'filled'
+        ),
+        entry_counts AS (
+            SELECT bot_name, symbol, COUNT(*) AS n, MIN(created_at) AS first_seen
+            FROM filled_entries
+            GROUP BY bot_name, symbol
+        ),
+        exit_counts AS (
+            SELECT COALESCE(bot_name, 'Unknown Bot') AS bot_name, symbol, COUNT(*) AS n
+            FROM signals
+            WHERE signal_type = 'exit' AND status = 'executed'
+            GROUP BY 1, 2
+        ),
+        open_pos AS (
+            SELECT e.bot_name, e.symbol, e.first_seen, e.n - COALESCE(x.n, 0) AS open_count
+            FROM entry_counts e
+            LEFT JOIN exit_counts x USING (bot_name, symbol)
+            WHERE e.n - COALESCE(x.n, 0) > 0
+        ),
+        ranked AS (
+            SELECT f.*, ROW_NUMBER() OVER (
+                PARTITION BY bot_name, symbol ORDER BY created_at DESC, id DESC
+            ) AS rn
+            FROM filled_entries f
+        )
+        SELECT r.bot_name, r.symbol, r.entry_1, r.position_size_actual, r.created_at
+        FROM ranked r
+        JOIN open_pos o USING (bot_name, symbol)
+        WHERE r.rn <= o.open_count
+        ORDER BY o.first_seen ASC, r.created_at ASC, r.id ASC
+    """
+    active = pd.read_sql_query(active_query, conn, dtype={'entry_1': float, 'position_size_actual': float})
+
+    # Keep the report's bot order (stable sort preserves symbol/time order within a bot)
+    bot_order = {bot: i for i, bot in enumerate(bots)}
+    active = active.sort_values('bot_name', key=lambda col: col.map(bot_order), kind='stable')
+
+    for row in active.itertuples(index=False):
+        # Clean Timestamp
+        time_str = str(row.created_at)[5:16].replace("T", " ")
         
-        for sym in symbols:
-            # Netting: Buys - Sells = Open Positions
-            n_buys = len(bot_entries[bot_entries['symbol'] == sym])
-            n_sells = len(bot_exits[bot_exits['symbol'] == sym])
-            open_count = n_buys - n_sells
-            
-            if open_count > 0:
-                active_found = True
-                # Get the N most recent entries
-                specific_entries = bot_entries[bot_entries['symbol'] == sym].tail(open_count)
-                
-                for _, row in specific_entries.iterrows():
-                    # Clean Timestamp
-                    time_str = str(row['created_at'])[5:16].replace("T", " ")
-                    
-                    print(f"{Fore.WHITE}{bot[:20]:<20} | {Fore.CYAN}{sym:<8}{Fore.RESET} | ${row['entry_1']:<9} | {row['position_size_actual']:<10} | {time_str}")
-
-    if not active_found:
+        print(f"{Fore.WHITE}{row.bot_name[:20]:<20} | {Fore.CYAN}{row.symbol:<8}{Fore.RESET} | ${row.entry_1:<9} | {row.position_size_actual:<10} | {time_str}")
+
+    if active.empty:
         print(f"{Fore.YELLOW}💤 No active positions.")
 
     print("=" * 70 + "\n")
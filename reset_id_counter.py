@@ -2,19 +2,23 @@
 UTILITY: ID Reset
 Clears the 'signals' table AND resets the auto-increment ID back to 1.
 """
-import sqlite3
 from colorama import Fore, Style, init
+from db import get_conn
 
 init(autoreset=True)
 DB_PATH = "/Users/johnny_main/Developer/data/signals/signals.db"
 
 def reset_ids():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn(DB_PATH)
     c = conn.cursor()
 
     try:
         # 1. Clear the data (Again, in case new signals arrived)
         c.execute("DELETE FROM signals")
+        # ...and their TP order rows (table only exists once a bot has started)
+        c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='signal_tps'")
+        if c.fetchone():
+            c.execute("DELETE FROM signal_tps")
         
         # 2. THE SECRET SAUCE: Reset the internal sequence counter
         c.execute("DELETE FROM sqlite_sequence WHERE name='signals'")
@@ -24,9 +28,8 @@ def reset_ids():
         print(f"{Fore.CYAN}   The next signal received will be ID: 1")
 
     except Exception as e:
+        conn.rollback()
         print(f"{Fore.RED}❌ Error: {e}")
-    finally:
-        conn.close()
 
 if __name__ == "__main__":
     reset_ids()
\ No newline at end of file
@@ -1,12 +1,12 @@
 import sqlite3
-import pandas as pd
 
 # Path to your database
 DB_PATH = "/Users/johnny_main/Developer/data/signals/signals.db"
 
 def inspect_recent_signals():
     try:
-        conn = sqlite3.connect(DB_PATH)
+        # Read-only: never creates an empty DB if DB_PATH is wrong
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
         
         # Get last 5 signals
         query = """
@@ -16,26 +16,26 @@ def inspect_recent_signals():
         LIMIT 5
         """
         
-        df = pd.read_sql_query(query, conn)
+        rows = conn.cursor().execute(query).fetchall()
         conn.close()
         
-        if df.empty:
+        if not rows:
             print("❌ Database is EMPTY.")
             return
 
         print("\n📊 LAST 5 SIGNALS IN DATABASE:")
         print("=" * 80)
         # Iterate nicely
-        for index, row in df.iterrows():
+        for id_, bot, sym, stype, status, ts, raw in rows:
             # Truncate raw message for display
-            msg_snippet = (row['raw_message'][:30] + '...') if row['raw_message'] else 'None'
+            msg_snippet = (raw[:30] + '...') if raw else 'None'
             
-            print(f"🆔 ID: {row['id']}")
-            print(f"🤖 Bot: {row['bot_name']}")
-            print(f"🪙 Sym: {row['symbol']}")
-            print(f"🚦 Type: {row['signal_type']}  <-- CRITICAL")
-            print(f"📝 Stat: {row['status']}       <-- CRITICAL")
-            print(f"⏰ Time: {row['created_at']}")
+            print(f"🆔 ID: {id_}")
+            print(f"🤖 Bot: {bot}")
+            print(f"🪙 Sym: {sym}")
+            print(f"🚦 Type: {stype}  <-- CRITICAL")
+            print(f"📝 Stat: {status}       <-- CRITICAL")
+            print(f"⏰ Time: {ts}")
             print("-" * 80)
 
     except Exception as e:
@@ -6,7 +6,7 @@ Fleet Connectivity & Health Check Script.
 This script verifies the API connection for ALL defined fleet wallets.
 
 CAPABILITIES:
-1. Multi-Wallet Support: Loops through all keys defined in .env (ALCHEMIST, SENTIENT, ALPHA).
+1. Multi-Wallet Support: Checks all keys defined in .env (ALCHEMIST, SENTIENT, ALPHA) concurrently.
 2. Deep Health Check: For each wallet, it reads:
    - Equity & Margin
    - Open Positions
@@ -19,10 +19,12 @@ python test/connection_test.py
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv, find_dotenv
 from eth_account import Account
 from hyperliquid.info import Info
 from hyperliquid.utils import constants
+from requests.adapters import HTTPAdapter
 
 # --- 1. Load Environment ---
 load_dotenv(find_dotenv())
@@ -44,19 +46,25 @@ print("------------------------------------------------")
 base_url = constants.MAINNET_API_URL if IS_MAINNET else constants.TESTNET_API_URL
 info = Info(base_url, skip_ws=True)
 
-# --- 3. Iterate Through Each Bot ---
-for bot_name, private_key in FLEET_CHECKLIST.items():
-    print(f"\n🤖  TESTING: {bot_name}")
+# /info takes one request type per POST, so the two calls per wallet can't be merged.
+# Instead every call shares Info's keep-alive session; size its pool to the worker
+# count so concurrent checks reuse warm TLS connections instead of discarding them.
+info.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=len(FLEET_CHECKLIST)))
+
+# --- 3. Check Each Bot ---
+def check_wallet(bot_name, private_key, log=print):
+    """Runs the health check for one wallet, reporting through log()"""
+    log(f"\n🤖  TESTING: {bot_name}")
     
     if not private_key:
-        print(f"   ⚠️  Skipping: No Private Key found in .env")
-        continue
+        log(f"   ⚠️  Skipping: No Private Key found in .env")
+        return
 
     try:
         # Connect
         account = Account.from_key(private_key)
         address = account.address
-        print(f"   🔑  Wallet: {address}")
+        log(f"   🔑  Wallet: {address}")
 
         # [Check 1] Account Status
         user_state = info.user_state(address)
@@ -64,31 +72,44 @@ for bot_name, private_key in FLEET_CHECKLIST.items():
         equity = float(margin.get("accountValue", 0))
         margin_used = float(margin.get("totalMarginUsed", 0))
         
-        print(f"   ✅  Connection Successful")
-        print(f"       💰 Equity:      ${equity:,.2f}")
-        print(f"       📉 Margin Used: ${margin_used:,.2f}")
+        log(f"   ✅  Connection Successful")
+        log(f"       💰 Equity:      ${equity:,.2f}")
+        log(f"       📉 Margin Used: ${margin_used:,.2f}")
 
         # [Check 2] Active Positions
         raw_positions = user_state.get("assetPositions", [])
         active_positions = [p for p in raw_positions if float(p["position"]["szi"]) != 0]
         
         if active_positions:
-            print(f"       📊  {len(active_positions)} Active Position(s):")
+            log(f"       📊  {len(active_positions)} Active Position(s):")
             for p in active_positions:
                 pos = p["position"]
-                print(f"           - {pos['coin']} ({pos['szi']} sz)")
+                log(f"           - {pos['coin']} ({pos['szi']} sz)")
         else:
-            print("       ℹ️  No active positions.")
+            log("       ℹ️  No active positions.")
 
         # [Check 3] Open Orders
         open_orders = info.frontend_open_orders(address)
         if open_orders:
-            print(f"       📝  {len(open_orders)} Open Order(s)")
+            log(f"       📝  {len(open_orders)} Open Order(s)")
         else:
-            print("       ℹ️  No open orders.")
+            log("       ℹ️  No open orders.")
 
     except Exception as e:
-        print(f"   ❌  CONNECTION FAILED: {e}")
+        log(f"   ❌  CONNECTION FAILED: {e}")
+
+
+# Wallets are independent and the checks are pure network I/O, so run them all at
+# once; each report is buffered and printed in fleet order so output doesn't interleave
+def check_buffered(item):
+    name, key = item
+    lines = []
+    check_wallet(name, key, log=lines.append)
+    return lines
+
+with ThreadPoolExecutor(max_workers=len(FLEET_CHECKLIST)) as pool:
+    for lines in pool.map(check_buffered, FLEET_CHECKLIST.items()):
+        print("\n".join(lines))
 
 print("\n------------------------------------------------")
 print("✅  FLEET DIAGNOSTIC COMPLETE")
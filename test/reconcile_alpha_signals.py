@@ -6,13 +6,22 @@ to identify and troubleshoot mismatches in the trading pipeline.
 
 Usage:
     python test/reconcile_alpha_signals.py
+    python test/reconcile_alpha_signals.py --profile    # Also print hottest functions and per-regex time
 """
 
+import argparse
+import cProfile
+import mmap
+import pstats
 import sqlite3
 import os
 import re
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from dotenv import load_dotenv
 from eth_account import Account
 from hyperliquid.info import Info
@@ -31,28 +40,128 @@ FLEET_LOG_PATH = "/Users/johnny_main/Developer/data/logs/fleet_launchd.err"
 PARSER_LOG_PATH = "/Users/johnny_main/Developer/data/logs/telegram_signals_sqlite.log"
 BOT_NAME = "AlphaCryptoSignal"
 
+# A fill within this many seconds of a signal's created_at counts as its execution
+FILL_MATCH_SECONDS = 300.0
+
+# Only the columns the reconciler and its report read (no SELECT *)
+SIGNAL_COLUMNS = "id, bot_name, symbol, direction, entry_1, status, signal_type, created_at, notes, position_size_actual"
+
+# Bytes read per step when scanning the fleet log backwards
+TAIL_BLOCK_SIZE = 65536
+
+# Fleet log patterns, compiled once and reused for every line. Keep each pattern separate and
+# starting with its literal (no fused (a|b) alternation) so SRE can use its literal-prefix scan.
+SUCCESS_RE = re.compile(r'Signal (\d+) SUCCESS')             # "✅ Signal 7 SUCCESS. Orders Placed."
+
+# Patterns wrapped by RegexTimer under --profile
+PROFILED_PATTERNS = ['SUCCESS_RE']
+PROFILE_TOP_N = 30
+
+# logging's asctime always starts the line at a fixed width: "2026-01-10 08:27:29,018 - ..."
+TIMESTAMP_WIDTH = 19
+
+
+class Fill(NamedTuple):
+    """A Hyperliquid fill (tuple-backed: no per-fill dict)"""
+    ticker: str
+    side: str
+    size: float
+    price: float
+    timestamp: datetime
+    ts_epoch: float       # Same instant as epoch seconds, for cheap float window compares
+
+
+class RegexTimer:
+    """Stands in for a compiled pattern and accumulates time spent in .search()/.match() (--profile)"""
+
+    def __init__(self, name: str, pattern: re.Pattern):
+        self.name = name
+        self.pattern = pattern
+        self.calls = 0
+        self.total_ns = 0
+
+    def search(self, *args):
+        start = time.perf_counter_ns()
+        try:
+            return self.pattern.search(*args)
+        finally:
+            self.total_ns += time.perf_counter_ns() - start
+            self.calls += 1
+
+    def match(self, *args):
+        start = time.perf_counter_ns()
+        try:
+            return self.pattern.match(*args)
+        finally:
+            self.total_ns += time.perf_counter_ns() - start
+            self.calls += 1
+
+    def summary(self) -> str:
+        per_call = self.total_ns / self.calls / 1000 if self.calls else 0.0
+        return f"{self.name}: {self.calls} calls, {self.total_ns / 1000:.0f} µs total, {per_call:.2f} µs/call"
+
+
+def _call_profiled(profiles: List[cProfile.Profile], fn, *args, **kwargs):
+    """Run fn under its own profiler; cProfile only sees the thread that enabled it"""
+    profiler = cProfile.Profile()
+    profiles.append(profiler)
+    return profiler.runcall(fn, *args, **kwargs)
+
+
+def _get(row, key: str, default=None):
+    """dict.get() for both dict rows and sqlite3.Row (which has no .get())"""
+    try:
+        return row[key]
+    except (IndexError, KeyError):
+        return default
+
 
 class DatabaseCollector:
     """Query all AlphaCryptoSignal signals from signals.db"""
 
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
+        self._cache: Optional[List[Dict]] = None  # Rows from the first successful query
+        self._ensure_index()
+
+    def _ensure_index(self):
+        """Create the (bot_name, created_at DESC) index get_all_signals() reads in order,
+        so SQLite walks the index instead of scanning the table and sorting"""
+        if not os.path.exists(self.db_path):
+            return  # Don't let sqlite3.connect() create an empty database
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signals_bot_created ON signals(bot_name, created_at DESC)")
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            # Read-only or locked database: the query still works, just without the index
+            print(f"{Fore.YELLOW}⚠️  Could not create idx_signals_bot_created: {e}")
+
+    def invalidate(self):
+        """Drop the cached rows so the next call re-queries the database"""
+        self._cache = None
 
     def get_all_signals(self) -> List[Dict]:
-        """Retrieve all signals for AlphaCryptoSignal bot"""
+        """Retrieve all signals for AlphaCryptoSignal bot as sqlite3.Row (queried once, then served from cache)"""
+        if self._cache is not None:
+            return self._cache
+
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM signals
+            cursor.execute(f"""
+                SELECT {SIGNAL_COLUMNS} FROM signals
                 WHERE bot_name = ?
                 ORDER BY created_at DESC
             """, (BOT_NAME,))
 
-            signals = [dict(row) for row in cursor.fetchall()]
+            # sqlite3.Row already supports signal['col']; no per-row dict copy
+            signals = cursor.fetchall()
             conn.close()
+            self._cache = signals
             return signals
         except Exception as e:
             print(f"{Fore.RED}❌ Database Error: {e}")
@@ -85,12 +194,16 @@ class HyperliquidCollector:
     def get_positions(self) -> List[Dict]:
         """Get current open positions"""
         try:
-            state = self.info.user_state(self.address)
+            # Two independent round-trips; overlap them
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                state_future = pool.submit(self.info.user_state, self.address)
+                mids_future = pool.submit(self.info.all_mids)
+                state = state_future.result()
+                all_mids = mids_future.result()
             positions = state.get("assetPositions", [])
 
             # Filter for active positions only
             active = []
-            all_mids = self.info.all_mids()
 
             for p in positions:
                 pos = p["position"]
@@ -123,7 +236,7 @@ class HyperliquidCollector:
             print(f"{Fore.YELLOW}⚠️  Hyperliquid API Error: {e}")
             return []
 
-    def get_fills(self, hours: int = 24) -> List[Dict]:
+    def get_fills(self, hours: int = 24) -> List[Fill]:
         """Get recent fills (if available from API)"""
         try:
             # Note: user_fills may not be available in all API versions
@@ -138,15 +251,17 @@ class HyperliquidCollector:
             for fill in fills:
                 # Parse fill timestamp (format may vary)
                 try:
-                    fill_time = datetime.fromtimestamp(fill['time'] / 1000)
+                    ts_epoch = fill['time'] / 1000.0
+                    fill_time = datetime.fromtimestamp(ts_epoch)
                     if fill_time >= cutoff:
-                        recent_fills.append({
-                            'ticker': fill['coin'],
-                            'side': 'LONG' if float(fill['sz']) > 0 else 'SHORT',
-                            'size': abs(float(fill['sz'])),
-                            'price': float(fill['px']),
-                            'timestamp': fill_time
-                        })
+                        recent_fills.append(Fill(
+                            ticker=fill['coin'],
+                            side='LONG' if float(fill['sz']) > 0 else 'SHORT',
+                            size=abs(float(fill['sz'])),
+                            price=float(fill['px']),
+                            timestamp=fill_time,
+                            ts_epoch=ts_epoch
+                        ))
                 except:
                     continue
 
@@ -161,64 +276,150 @@ class FleetLogParser:
 
     def __init__(self, log_path: str = FLEET_LOG_PATH):
         self.log_path = log_path
+        self.reset()
+
+    def reset(self):
+        """Forget everything parsed so far (e.g. after the log has grown)"""
+        # Backward scan state for correlate_signal_to_log(), shared across calls in one pass
+        self._tail_pos = None     # Byte offset the unscanned region ends at (file size on first call)
+        self._tail_carry = b''    # Partial line left over at the front of the last block read
+        self._tail_found = {}     # signal_id -> latest success entry seen so far
+        # Full parse, memoized for the run
+        self._cache = None        # parse_execution_logs() result
+        self._by_id = None        # signal_id -> latest success entry, from the full parse
 
     def parse_execution_logs(self) -> List[Dict]:
-        """Extract execution details for AlphaCryptoSignal"""
+        """Extract execution details for AlphaCryptoSignal (parsed once per run)"""
+        if self._cache is not None:
+            return self._cache
+
         if not os.path.exists(self.log_path):
             return []
 
         executions = []
 
         try:
-            with open(self.log_path, 'r') as f:
-                lines = f.readlines()
-
-            for line in lines:
-                if BOT_NAME not in line:
-                    continue
-
-                # Parse success messages: "✅ Signal 7 SUCCESS. Orders Placed."
-                success_match = re.search(r'Signal (\d+) SUCCESS', line)
-                if success_match:
-                    signal_id = int(success_match.group(1))
-                    timestamp = self._extract_timestamp(line)
-                    executions.append({
-                        'signal_id': signal_id,
-                        'status': 'success',
-                        'timestamp': timestamp,
-                        'log_line': line.strip()
-                    })
+            with open(self.log_path, 'rb') as f:
+                for line in self._bot_lines(f):
+                    # Cheap substring guard: only success ('SUCCESS') and failure ('❌') lines can match below
+                    has_success = 'SUCCESS' in line
+                    if not has_success and '❌' not in line:
+                        continue
+
+                    # Parse success messages: "✅ Signal 7 SUCCESS. Orders Placed."
+                    # (the regex only runs on lines carrying its literal marker)
+                    success_match = SUCCESS_RE.search(line) if has_success else None
+                    if success_match:
+                        signal_id = int(success_match.group(1))
+                        timestamp = self._extract_timestamp(line)
+                        executions.append({
+                            'signal_id': signal_id,
+                            'status': 'success',
+                            'timestamp': timestamp,
+                            'log_line': line.strip()
+                        })
 
-                # Parse failure messages: "❌ Execution Failed: ..."
-                elif '❌ Execution Failed' in line or '❌ Signal' in line:
-                    timestamp = self._extract_timestamp(line)
-                    # Try to extract signal context from nearby lines
-                    executions.append({
-                        'signal_id': None,
-                        'status': 'failed',
-                        'timestamp': timestamp,
-                        'log_line': line.strip()
-                    })
+                    # Parse failure messages: "❌ Execution Failed: ..."
+                    elif '❌ Execution Failed' in line or '❌ Signal' in line:
+                        timestamp = self._extract_timestamp(line)
+                        # Try to extract signal context from nearby lines
+                        executions.append({
+                            'signal_id': None,
+                            'status': 'failed',
+                            'timestamp': timestamp,
+                            'log_line': line.strip()
+                        })
 
+            self._cache = executions
+            self._by_id = {e['signal_id']: e for e in executions if e['signal_id'] is not None}
             return executions
         except Exception as e:
             print(f"{Fore.YELLOW}⚠️  Log Parse Error: {e}")
             return []
 
+    @staticmethod
+    def _bot_lines(f):
+        """Yield the decoded lines that mention BOT_NAME. The file is memory-mapped and searched
+        for the name directly, so lines from other bots are never split out or decoded."""
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap refuses empty files
+        marker = BOT_NAME.encode()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(marker)
+            while pos != -1:
+                start = mm.rfind(b'\n', 0, pos) + 1
+                end = mm.find(b'\n', pos)
+                if end == -1:
+                    end = len(mm)
+                yield mm[start:end].decode('utf-8', errors='replace')
+                pos = mm.find(marker, end)
+
     def correlate_signal_to_log(self, signal_id: int) -> Optional[Dict]:
-        """Find log entries for a specific signal ID"""
-        executions = self.parse_execution_logs()
-        return next((e for e in executions if e['signal_id'] == signal_id), None)
+        """Find the latest success entry for a specific signal ID, reading the log from the end"""
+        if self._by_id is not None:
+            return self._by_id.get(signal_id)
+        if signal_id not in self._tail_found:
+            try:
+                self._scan_tail_until(signal_id)
+            except OSError:
+                return None
+        return self._tail_found.get(signal_id)
+
+    def _scan_tail_until(self, signal_id: int):
+        """Read the log backwards in blocks until signal_id is seen or the start is reached.
+        Recent signals sit near the end of the append-only log, and each call resumes where the
+        previous one stopped, so a full reconciliation pass reads the file at most once."""
+        with open(self.log_path, 'rb') as f:
+            if self._tail_pos is None:
+                self._tail_pos = f.seek(0, os.SEEK_END)
+
+            while signal_id not in self._tail_found and self._tail_pos > 0:
+                start = max(0, self._tail_pos - TAIL_BLOCK_SIZE)
+                f.seek(start)
+                lines = (f.read(self._tail_pos - start) + self._tail_carry).split(b'\n')
+                self._tail_pos = start
+                # The first piece is only a whole line once the start of the file is reached
+                self._tail_carry = lines.pop(0) if start > 0 else b''
+
+                for raw in reversed(lines):
+                    line = raw.decode('utf-8', errors='replace')
+                    if BOT_NAME not in line or 'SUCCESS' not in line:
+                        continue
+                    success_match = SUCCESS_RE.search(line)
+                    if success_match:
+                        self._tail_found.setdefault(int(success_match.group(1)), {
+                            'signal_id': int(success_match.group(1)),
+                            'status': 'success',
+                            'timestamp': self._extract_timestamp(line),
+                            'log_line': line.strip()
+                        })
 
     def _extract_timestamp(self, log_line: str) -> Optional[datetime]:
         """Extract timestamp from log line"""
-        # Format: "2026-01-10 08:27:29,018 - ..."
-        match = re.search(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', log_line)
-        if match:
-            return datetime.strptime(match.group(1), '%Y-%m-%d %H:%M:%S')
+        # Format: "2026-01-10 08:27:29,018 - ..." - fixed columns, so slice instead of running a regex
+        ts = log_line[:TIMESTAMP_WIDTH]
+        if (len(ts) == TIMESTAMP_WIDTH and ts[4] == ts[7] == '-' and ts[10] == ' ' and ts[13] == ts[16] == ':'
+                and (ts[0:4] + ts[5:7] + ts[8:10] + ts[11:13] + ts[14:16] + ts[17:19]).isdecimal()):
+            return datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                            int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
         return None
 
 
+class FillColumns(NamedTuple):
+    """One ticker's fills as parallel lists, sorted by time"""
+    times: List[float]    # Epoch seconds
+    prices: List[float]
+    order: List[int]      # Position in the original hl_fills list
+    fills: List[Fill]
+
+
+class ReconcileResult(NamedTuple):
+    """Mismatch categories 2-4 from one SignalReconciler pass"""
+    unexecuted: List[Dict]
+    mismatches: List[Dict]
+    orphans: List[Dict]
+
+
 class SignalReconciler:
     """Compare data sources and identify mismatches"""
 
@@ -229,62 +430,106 @@ class SignalReconciler:
         self.hl_fills = hl_fills
         self.log_executions = log_executions
 
+        # Hash indexes built once so per-signal matching is O(1) instead of a list scan.
+        # Positions keep the first entry, matching the old next(...) scan. Log entries are in
+        # file order and the latest one per signal wins, as in FleetLogParser's lookups.
+        self._pos_by_ticker = {}
+        for p in hl_positions:
+            self._pos_by_ticker.setdefault(p['ticker'], p)
+
+        self._log_by_signal = {e['signal_id']: e for e in log_executions if e['signal_id'] is not None}
+
+        # ticker -> FillColumns: parallel lists sorted by fill time, so the match window is a
+        # bisect and the price check reads a flat float list instead of a record per fill
+        by_ticker = defaultdict(list)
+        for i, f in enumerate(hl_fills):
+            by_ticker[f.ticker].append((f.ts_epoch, i, f))
+        self._fills_by_ticker = {}
+        for ticker, rows in by_ticker.items():
+            rows.sort(key=lambda r: (r[0], r[1]))
+            self._fills_by_ticker[ticker] = FillColumns(
+                times=[r[0] for r in rows],
+                prices=[r[2].price for r in rows],
+                order=[r[1] for r in rows],
+                fills=[r[2] for r in rows]
+            )
+
+        # Symbols with an entry signal; a position outside this set is an orphan
+        self._entry_symbols = frozenset(s['symbol'] for s in db_signals if s['signal_type'] == 'entry')
+
+        self._result = None  # reconcile() output, computed once
+
+    def reconcile(self) -> ReconcileResult:
+        """Classify everything in one pass over the signals (plus one over positions); cached"""
+        if self._result is not None:
+            return self._result
+
+        unexecuted = []
+        mismatches = []
+
+        for signal in self.db_signals:
+            if signal['status'] in ('pending', 'failed'):
+                unexecuted.append(signal)
+            elif signal['status'] == 'filled':
+                mismatches.extend(self._price_mismatches(signal))
+
+        orphans = [pos for pos in self.hl_positions if pos['ticker'] not in self._entry_symbols]
+
+        self._result = ReconcileResult(unexecuted, mismatches, orphans)
+        return self._result
+
+    def _price_mismatches(self, signal: Dict) -> List[Dict]:
+        """Fills within the match window whose price is >5% off the signal's entry"""
+        # Compare database position_size_actual with expected
+        # Note: Expected size calculation would require equity data
+        # For now, we'll flag if position_size_actual differs significantly from fills
+
+        # Try to find matching fill (±5 min), via bisect on the ticker's sorted fill times
+        cols = self._fills_by_ticker.get(signal['symbol'])
+        entry_price = float(signal['entry_1']) if signal['entry_1'] else 0
+        if cols is None or entry_price <= 0:
+            return []
+
+        # created_at is naive local time, like datetime.fromtimestamp() on the fill side;
+        # convert once to epoch seconds and compare floats from here on
+        signal_ts = datetime.fromisoformat(signal['created_at']).timestamp()
+        lo = bisect_right(cols.times, signal_ts - FILL_MATCH_SECONDS)
+        hi = bisect_left(cols.times, signal_ts + FILL_MATCH_SECONDS)
+
+        flagged = []
+        for k in range(lo, hi):
+            # Check price difference
+            price_diff_pct = abs(cols.prices[k] - entry_price) / entry_price
+            if price_diff_pct > 0.05:  # >5% difference
+                flagged.append((cols.order[k], k, price_diff_pct))
+
+        # Report in the API's original fill order, as before
+        flagged.sort()
+        return [{
+            'signal': signal,
+            'fill': cols.fills[k],
+            'issue': f'Price mismatch: signal={entry_price:.4f}, fill={cols.prices[k]:.4f} ({price_diff_pct*100:.1f}% diff)'
+        } for _, k, price_diff_pct in flagged]
+
     def find_unexecuted(self) -> List[Dict]:
         """Type 2: Signals in DB but not executed (status='pending' or 'failed')"""
-        return [s for s in self.db_signals if s['status'] in ['pending', 'failed']]
+        return self.reconcile().unexecuted
 
     def find_parameter_mismatches(self) -> List[Dict]:
         """Type 3: Executed with wrong size/price"""
-        mismatches = []
-
-        for signal in self.db_signals:
-            if signal['status'] != 'filled':
-                continue
-
-            # Compare database position_size_actual with expected
-            # Note: Expected size calculation would require equity data
-            # For now, we'll flag if position_size_actual differs significantly from fills
-
-            # Try to find matching fill
-            signal_time = datetime.fromisoformat(signal['created_at'])
-            matching_fills = [
-                f for f in self.hl_fills
-                if f['ticker'] == signal['symbol']
-                and abs((f['timestamp'] - signal_time).total_seconds()) < 300  # ±5 min
-            ]
-
-            for fill in matching_fills:
-                # Check price difference
-                entry_price = float(signal['entry_1']) if signal['entry_1'] else 0
-                if entry_price > 0:
-                    price_diff_pct = abs(fill['price'] - entry_price) / entry_price
-                    if price_diff_pct > 0.05:  # >5% difference
-                        mismatches.append({
-                            'signal': signal,
-                            'fill': fill,
-                            'issue': f'Price mismatch: signal={entry_price:.4f}, fill={fill["price"]:.4f} ({price_diff_pct*100:.1f}% diff)'
-                        })
-
-        return mismatches
+        return self.reconcile().mismatches
 
     def find_orphan_positions(self) -> List[Dict]:
         """Type 4: Positions with no matching signal in database"""
-        db_entry_symbols = {s['symbol'] for s in self.db_signals if s['signal_type'] == 'entry'}
-        orphans = []
-
-        for pos in self.hl_positions:
-            if pos['ticker'] not in db_entry_symbols:
-                orphans.append(pos)
-
-        return orphans
+        return self.reconcile().orphans
 
     def match_signal_to_position(self, signal: Dict) -> Optional[Dict]:
         """Find Hyperliquid position matching a database signal"""
-        return next((p for p in self.hl_positions if p['ticker'] == signal['symbol']), None)
+        return self._pos_by_ticker.get(signal['symbol'])
 
     def match_signal_to_log(self, signal: Dict) -> Optional[Dict]:
         """Find fleet log entry matching a database signal"""
-        return next((e for e in self.log_executions if e['signal_id'] == signal['id']), None)
+        return self._log_by_signal.get(signal['id'])
 
 
 def generate_report(reconciler: SignalReconciler, db_signals: List[Dict],
@@ -303,9 +548,7 @@ def generate_report(reconciler: SignalReconciler, db_signals: List[Dict],
     lines.append("")
 
     # Summary
-    unexecuted = reconciler.find_unexecuted()
-    param_mismatches = reconciler.find_parameter_mismatches()
-    orphan_positions = reconciler.find_orphan_positions()
+    unexecuted, param_mismatches, orphan_positions = reconciler.reconcile()
 
     matched_count = len([s for s in db_signals if s['status'] == 'filled'])
     total_issues = len(unexecuted) + len(param_mismatches) + len(orphan_positions)
@@ -441,7 +684,7 @@ def generate_report(reconciler: SignalReconciler, db_signals: List[Dict],
         status_icon = f"{Fore.GREEN}✅ FULLY MATCHED" if is_matched else f"{Fore.YELLOW}⚠️  PARTIAL"
 
         lines.append(f"{Style.BRIGHT}Signal ID {signal['id']}: {signal['symbol']} {signal['direction']} {status_icon}")
-        lines.append(f"├─ Database:     {signal['created_at']} | entry={signal['entry_1']} | status='{signal['status']}' | size={signal.get('position_size_actual', 'N/A')}")
+        lines.append(f"├─ Database:     {signal['created_at']} | entry={signal['entry_1']} | status='{signal['status']}' | size={_get(signal, 'position_size_actual', 'N/A')}")
 
         if log_entry:
             lines.append(f"├─ Fleet Log:    {log_entry['timestamp']} | {log_entry['status']}")
@@ -483,34 +726,53 @@ def generate_report(reconciler: SignalReconciler, db_signals: List[Dict],
     return "\n".join(lines)
 
 
-def main():
-    """Main reconciliation function"""
+def run_reconciliation(profiles: Optional[List[cProfile.Profile]] = None):
+    """Collect, reconcile and print the report. With profiles, each worker task is profiled into it."""
     print(f"\n{Fore.CYAN}{Style.BRIGHT}Starting AlphaCryptoSignal Reconciliation...")
     print("")
 
     # Collect data from all sources
     print(f"{Fore.YELLOW}📊 Collecting data from sources...")
 
-    # Database
     db_collector = DatabaseCollector()
-    db_signals = db_collector.get_all_signals()
-    print(f"   ✓ Database: {len(db_signals)} signals")
-
-    # Hyperliquid
+    log_parser = FleetLogParser()
     try:
         hl_collector = HyperliquidCollector()
-        hl_positions = hl_collector.get_positions()
-        hl_fills = hl_collector.get_fills(hours=24)
-        print(f"   ✓ Hyperliquid: {len(hl_positions)} positions, {len(hl_fills)} fills")
+        hl_error = None
     except Exception as e:
-        print(f"{Fore.RED}   ✗ Hyperliquid: Error - {e}")
-        hl_positions = []
-        hl_fills = []
+        hl_collector = None
+        hl_error = e
+
+    # The sources are independent and I/O-bound (SQLite, HTTPS, log file), so fetch them at once
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        def submit(fn, *args, **kwargs):
+            if profiles is None:
+                return pool.submit(fn, *args, **kwargs)
+            return pool.submit(_call_profiled, profiles, fn, *args, **kwargs)
+
+        db_future = submit(db_collector.get_all_signals)
+        log_future = submit(log_parser.parse_execution_logs)
+        if hl_collector:
+            positions_future = submit(hl_collector.get_positions)
+            fills_future = submit(hl_collector.get_fills, hours=24)
+
+        # Database
+        db_signals = db_future.result()
+        print(f"   ✓ Database: {len(db_signals)} signals")
+
+        # Hyperliquid
+        if hl_collector:
+            hl_positions = positions_future.result()
+            hl_fills = fills_future.result()
+            print(f"   ✓ Hyperliquid: {len(hl_positions)} positions, {len(hl_fills)} fills")
+        else:
+            print(f"{Fore.RED}   ✗ Hyperliquid: Error - {hl_error}")
+            hl_positions = []
+            hl_fills = []
 
-    # Fleet logs
-    log_parser = FleetLogParser()
-    log_executions = log_parser.parse_execution_logs()
-    print(f"   ✓ Fleet logs: {len(log_executions)} execution entries")
+        # Fleet logs
+        log_executions = log_future.result()
+        print(f"   ✓ Fleet logs: {len(log_executions)} execution entries")
 
     # Parser logs
     parser_log_exists = os.path.exists(PARSER_LOG_PATH)
@@ -529,5 +791,40 @@ def main():
     print(report)
 
 
+def main():
+    """Main reconciliation function"""
+    parser = argparse.ArgumentParser(description='Reconcile AlphaCryptoSignal signals, fills and logs')
+    parser.add_argument('--profile', action='store_true',
+                        help=f'Profile the run: top {PROFILE_TOP_N} functions by cumulative time, plus time per regex')
+    args = parser.parse_args()
+
+    if not args.profile:
+        run_reconciliation()
+        return
+
+    # Swap the module-level patterns for timing wrappers; the parser looks them up at call time
+    timers = [RegexTimer(name, globals()[name]) for name in PROFILED_PATTERNS]
+    for timer in timers:
+        globals()[timer.name] = timer
+
+    profiles = []
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(run_reconciliation, profiles)
+    finally:
+        for timer in timers:
+            globals()[timer.name] = timer.pattern
+
+    print(f"\n{Fore.CYAN}{Style.BRIGHT}Profile (main thread + collector workers)")
+    stats = pstats.Stats(profiler)
+    for worker_profile in profiles:
+        stats.add(worker_profile)
+    stats.sort_stats('cumulative').print_stats(PROFILE_TOP_N)
+
+    print(f"{Fore.CYAN}{Style.BRIGHT}Regex time")
+    for timer in timers:
+        print(f"   {timer.summary()}")
+
+
 if __name__ == "__main__":
     main()
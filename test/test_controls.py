@@ -1,12 +1,12 @@
 import sys
 import os
-import sqlite3
 import time
 from dotenv import load_dotenv, find_dotenv
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from hyperliquid_top_gun import HyperLiquidTopGun
+from db import get_conn
 
 load_dotenv(find_dotenv())
 DB_PATH = "/Users/johnny_main/Developer/data/signals/signals.db"
@@ -20,11 +20,9 @@ TEST_FLEET = [
 
 def send_command(bot_name, command):
     print(f"   👉 Sending command: {command}")
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("INSERT INTO bot_controls (bot_id, command) VALUES (?, ?)", (bot_name, command))
+    conn = get_conn(DB_PATH)
+    conn.execute("INSERT INTO bot_controls (bot_id, command) VALUES (?, ?)", (bot_name, command))
     conn.commit()
-    conn.close()
 
 def run_test_for_bot(bot_config):
     name = bot_config["name"]
@@ -40,7 +38,7 @@ def run_test_for_bot(bot_config):
     try:
         # Initialize bot (with dummy risk args to satisfy init)
         bot = HyperLiquidTopGun(name, key, risk_per_trade=0.01)
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_conn(DB_PATH)
         
         # TEST 1: PAUSE
         send_command(name, "PAUSE")
@@ -60,8 +58,6 @@ def run_test_for_bot(bot_config):
             print("   ✅ RESUME SUCCESS")
         else:
             print("   ❌ RESUME FAILED")
-            
-        conn.close()
 
     except Exception as e:
         print(f"   ❌ CRITICAL ERROR: {e}")
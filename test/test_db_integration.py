@@ -1,7 +1,6 @@
 import sys
 import os
 import time
-import sqlite3
 import logging
 import threading
 from dotenv import load_dotenv, find_dotenv
@@ -9,6 +8,7 @@ from dotenv import load_dotenv, find_dotenv
 # Add parent directory to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from hyperliquid_top_gun import HyperLiquidTopGun
+from db import get_conn
 
 # --- Setup Logging ---
 logging.basicConfig(
@@ -19,6 +19,7 @@ logging.basicConfig(
 # --- Configuration ---
 load_dotenv(find_dotenv())
 DB_PATH = "/Users/johnny_main/Developer/data/signals/signals.db"
+STATUS_POLL_INTERVAL = 0.05  # Seconds between data_version checks while waiting on the bot
 
 # The Fleet to Test
 TEST_FLEET = [
@@ -28,46 +29,41 @@ TEST_FLEET = [
     }
 ]
 
-def inject_test_signal(bot_name):
-    """Injects a pending ENTRY signal for a specific bot."""
+def inject_test_signals(bot_names):
+    """Injects one pending ENTRY signal per bot in a single transaction; returns their IDs in order."""
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = get_conn(DB_PATH)
         c = conn.cursor()
+        signal_ids = []
         
-        # Injects a SAFE entry (ETH @ 1000) that won't fill immediately
-        c.execute("""
-            INSERT INTO signals 
-            (bot_name, symbol, direction, entry_1, target_1, stop_loss, status, signal_type, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-        """, (bot_name, "ETH", "LONG", "1000", "1100", "900", "pending", "entry"))
+        # Injects a SAFE entry (ETH @ 1000) that won't fill immediately.
+        # One commit (one fsync) for the whole batch; rows go in one by one so each lastrowid is exact.
+        with conn:
+            for bot_name in bot_names:
+                c.execute("""
+                    INSERT INTO signals 
+                    (bot_name, symbol, direction, entry_1, target_1, stop_loss, status, signal_type, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+                """, (bot_name, "ETH", "LONG", "1000", "1100", "900", "pending", "entry"))
+                signal_ids.append(c.lastrowid)
         
-        signal_id = c.lastrowid
-        conn.commit()
-        conn.close()
-        return signal_id
+        return signal_ids
     except Exception as e:
         print(f"❌ DB Error: {e}")
-        return None
+        return [None] * len(bot_names)
 
 def verify_signal_status(signal_id):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT status, notes FROM signals WHERE id = ?", (signal_id,))
-    row = c.fetchone()
-    conn.close()
+    conn = get_conn(DB_PATH)
+    row = conn.execute("SELECT status, notes FROM signals WHERE id = ?", (signal_id,)).fetchone()
     return row
 
-def run_single_test(bot_config):
+def run_single_test(bot_config, sig_id):
     bot_name = bot_config["name"]
     private_key = bot_config["key"]
     
     print(f"\n🤖 TESTING BOT: {bot_name}")
     print("-" * 40)
     
-    # 1. Inject Signal
-    print("📝 Injecting test signal...")
-    sig_id = inject_test_signal(bot_name)
-    
     # 2. Start Bot Instance
     try:
         bot = HyperLiquidTopGun(bot_name, private_key, risk_per_trade=0.01)
@@ -79,16 +75,23 @@ def run_single_test(bot_config):
         
         print(f"👀 Waiting for execution (Signal ID: {sig_id})...")
         
-        # 3. Wait up to 10 seconds
-        for i in range(10):
-            status, notes = verify_signal_status(sig_id)
-            if status == "filled":
-                print(f"✅ SUCCESS: Signal Filled (Order Placed)!")
-                return
-            elif status == "failed":
-                print(f"❌ FAILED: {notes}")
-                return
-            time.sleep(1)
+        # 3. Wait up to 10 seconds. PRAGMA data_version only changes when another
+        # connection (the bot's) commits, so the real SELECT runs only after a write.
+        conn = get_conn(DB_PATH)
+        last_version = None
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != last_version:
+                last_version = data_version
+                status, notes = verify_signal_status(sig_id)
+                if status == "filled":
+                    print(f"✅ SUCCESS: Signal Filled (Order Placed)!")
+                    return
+                elif status == "failed":
+                    print(f"❌ FAILED: {notes}")
+                    return
+            time.sleep(STATUS_POLL_INTERVAL)
             
         print("❌ TIMEOUT: Bot did not process the signal.")
 
@@ -96,6 +99,10 @@ def run_single_test(bot_config):
         print(f"❌ CRITICAL ERROR: {e}")
 
 if __name__ == "__main__":
-    for bot in TEST_FLEET:
-        run_single_test(bot)
+    # 1. Inject one test signal per bot up front, in one transaction
+    print("📝 Injecting test signals...")
+    sig_ids = inject_test_signals([bot["name"] for bot in TEST_FLEET])
+    
+    for bot, sig_id in zip(TEST_FLEET, sig_ids):
+        run_single_test(bot, sig_id)
         time.sleep(2)
\ No newline at end of file
@@ -1,5 +1,10 @@
 import re
 
+# Compiled once at import, as the parser does. The exit pattern stays on its own, led by the
+# 🔴 literal, so SRE's literal-prefix scan can skip non-exit text (don't fold it into an alternation).
+BOT_RE = re.compile(r'(SentientGuard|Apprentice Alchemist)', re.IGNORECASE)
+EXIT_RE = re.compile(r'🔴\s+([A-Z]+):\s+Closed\s+@\s+\$?([\d.]+)\s+\(Entry:\s+\$?([\d.]+)\),\s+Return:\s+([-\d.]+)%')
+
 def test_parsing():
     # The exact text you pasted
     text = """
@@ -13,12 +18,11 @@ Direction: Bullish 🟢
     print("-" * 40)
 
     # 1. Check Bot Name
-    bot_match = re.search(r'(SentientGuard|Apprentice Alchemist)', text, re.IGNORECASE)
+    bot_match = BOT_RE.search(text)
     print(f"🤖 Bot Match: {bot_match.group(1) if bot_match else 'None'}")
 
     # 2. Check Exits (The logic from your file)
-    exit_pattern = r'🔴\s+([A-Z]+):\s+Closed\s+@\s+\$?([\d.]+)\s+\(Entry:\s+\$?([\d.]+)\),\s+Return:\s+([-\d.]+)%'
-    exits = re.findall(exit_pattern, text)
+    exits = EXIT_RE.findall(text)
     
     print(f"📉 Exits Found: {len(exits)}")
     
@@ -7,7 +7,10 @@ Usage:
 
 import sys
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 # Add test directory to path for imports
 test_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,11 +24,33 @@ from reconcile_alpha_signals import (
 )
 
 
+# Shared across tests so one run queries SQLite and the Hyperliquid API once each
+@lru_cache(maxsize=1)
+def _db_collector() -> DatabaseCollector:
+    """One collector for the run; it caches its rows after the first query"""
+    return DatabaseCollector()
+
+
+@lru_cache(maxsize=1)
+def _hl_collector() -> HyperliquidCollector:
+    """One API client for the run (raises, uncached, if the key is missing)"""
+    return HyperliquidCollector()
+
+
+@lru_cache(maxsize=None)
+def _hl_snapshot(hours: int = 24):
+    """(positions, fills) fetched once per hours value; the two requests overlap"""
+    collector = _hl_collector()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        fills_future = pool.submit(collector.get_fills, hours=hours)
+        return collector.get_positions(), fills_future.result()
+
+
 def test_database_collector():
     """Test database query functionality"""
     print("\n🧪 Test 1: Database Collector")
 
-    collector = DatabaseCollector()
+    collector = _db_collector()
     signals = collector.get_all_signals()
 
     print(f"   ├─ Retrieved {len(signals)} signals")
@@ -33,20 +58,20 @@ def test_database_collector():
 
     if signals:
         # Verify known POL signal exists
-        pol_signals = [s for s in signals if s['symbol'] == 'POL']
-        if pol_signals:
-            pol = pol_signals[0]
+        pol = next((s for s in signals if s['symbol'] == 'POL'), None)
+        if pol:
             print(f"   ├─ Found POL signal (ID: {pol['id']})")
             assert pol['status'] == 'filled', f"POL should be filled, got {pol['status']}"
             assert pol['entry_1'] == 0.169, f"POL entry should be 0.169, got {pol['entry_1']}"
             assert pol['bot_name'] == 'AlphaCryptoSignal', "Should be AlphaCryptoSignal bot"
 
-        # Test entry/exit filters
-        entries = collector.get_entry_signals()
-        exits = collector.get_exit_signals()
-        print(f"   ├─ Entry signals: {len(entries)}")
-        print(f"   └─ Exit signals: {len(exits)}")
-        assert len(entries) + len(exits) == len(signals), "Entry + Exit should equal total"
+        # Test entry/exit filters against one counting pass over the fetched rows
+        counts = Counter(s['signal_type'] for s in signals)
+        print(f"   ├─ Entry signals: {counts['entry']}")
+        print(f"   └─ Exit signals: {counts['exit']}")
+        assert counts['entry'] + counts['exit'] == len(signals), "Entry + Exit should equal total"
+        assert len(collector.get_entry_signals()) == counts['entry'], "Entry filter count mismatch"
+        assert len(collector.get_exit_signals()) == counts['exit'], "Exit filter count mismatch"
 
     print("   ✅ Database Collector test passed")
     return True
@@ -57,22 +82,20 @@ def test_hyperliquid_collector():
     print("\n🧪 Test 2: Hyperliquid Collector")
 
     try:
-        collector = HyperliquidCollector()
+        collector = _hl_collector()
         print(f"   ├─ Connected to API (wallet: {collector.address[:8]}...)")
 
-        positions = collector.get_positions()
+        positions, fills = _hl_snapshot(hours=24)
         print(f"   ├─ Retrieved {len(positions)} positions")
         assert isinstance(positions, list), "Should return a list"
 
         if positions:
+            required = {'ticker', 'side', 'size', 'entry_px'}
             for pos in positions:
-                assert 'ticker' in pos, "Position should have ticker"
-                assert 'side' in pos, "Position should have side"
-                assert 'size' in pos, "Position should have size"
-                assert 'entry_px' in pos, "Position should have entry_px"
+                missing = required - pos.keys()
+                assert not missing, f"Position should have {', '.join(sorted(missing))}"
                 print(f"   ├─ {pos['ticker']}: {pos['side']} {pos['size']:.4f} @ ${pos['entry_px']:.4f}")
 
-        fills = collector.get_fills(hours=24)
         print(f"   └─ Retrieved {len(fills)} fills (24h)")
 
         print("   ✅ Hyperliquid Collector test passed")
@@ -173,8 +196,9 @@ def test_reconciler_logic():
     unexecuted = reconciler.find_unexecuted()
     print(f"   ├─ Unexecuted signals: {len(unexecuted)}")
     assert len(unexecuted) == 2, f"Should find 2 unexecuted (BTC pending, SOL failed), got {len(unexecuted)}"
-    assert any(s['symbol'] == 'BTC' for s in unexecuted), "Should include BTC (pending)"
-    assert any(s['symbol'] == 'SOL' for s in unexecuted), "Should include SOL (failed)"
+    unexecuted_symbols = {s['symbol'] for s in unexecuted}
+    assert 'BTC' in unexecuted_symbols, "Should include BTC (pending)"
+    assert 'SOL' in unexecuted_symbols, "Should include SOL (failed)"
 
     # Test 2: Find orphan positions
     orphans = reconciler.find_orphan_positions()
@@ -198,27 +222,27 @@ def test_full_reconciliation():
     print("\n🧪 Test 5: Full Reconciliation")
 
     try:
-        # Collect real data
-        db_collector = DatabaseCollector()
-        db_signals = db_collector.get_all_signals()
-        print(f"   ├─ Database: {len(db_signals)} signals")
+        # Collect real data; the sources are independent (SQLite, HTTPS, log file), so fetch them at once
+        log_parser = FleetLogParser()
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            db_future = pool.submit(_db_collector().get_all_signals)
+            hl_future = pool.submit(_hl_snapshot, hours=24)
+            log_future = pool.submit(log_parser.parse_execution_logs)
 
-        hl_collector = HyperliquidCollector()
-        hl_positions = hl_collector.get_positions()
-        hl_fills = hl_collector.get_fills(hours=24)
-        print(f"   ├─ Hyperliquid: {len(hl_positions)} positions, {len(hl_fills)} fills")
+            db_signals = db_future.result()
+            print(f"   ├─ Database: {len(db_signals)} signals")
 
-        log_parser = FleetLogParser()
-        log_executions = log_parser.parse_execution_logs()
-        print(f"   ├─ Fleet logs: {len(log_executions)} executions")
+            hl_positions, hl_fills = hl_future.result()
+            print(f"   ├─ Hyperliquid: {len(hl_positions)} positions, {len(hl_fills)} fills")
+
+            log_executions = log_future.result()
+            print(f"   ├─ Fleet logs: {len(log_executions)} executions")
 
         # Run reconciliation
         reconciler = SignalReconciler(db_signals, hl_positions, hl_fills, log_executions)
 
-        # Basic validation
-        unexecuted = reconciler.find_unexecuted()
-        orphans = reconciler.find_orphan_positions()
-        mismatches = reconciler.find_parameter_mismatches()
+        # Basic validation (one classification pass; the find_* accessors read the same result)
+        unexecuted, mismatches, orphans = reconciler.reconcile()
 
         print(f"   ├─ Analysis complete:")
         print(f"   │  ├─ Unexecuted: {len(unexecuted)}")
@@ -226,9 +250,8 @@ def test_full_reconciliation():
         print(f"   │  └─ Mismatches: {len(mismatches)}")
 
         # Verify POL signal is matched (if it exists in DB)
-        pol_signals = [s for s in db_signals if s['symbol'] == 'POL']
-        if pol_signals:
-            pol = pol_signals[0]
+        pol = next((s for s in db_signals if s['symbol'] == 'POL'), None)
+        if pol:
             if pol['status'] == 'filled':
                 # Should either have a position or be an exit
                 pos = reconciler.match_signal_to_position(pol)
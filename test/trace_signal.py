@@ -11,37 +11,86 @@ Usage:
     python test/trace_signal.py --signal-id 7
     python test/trace_signal.py --bot Alpha --recent 5
     python test/trace_signal.py --all  # Show all recent signals
+    python test/trace_signal.py --symbol POL --scan-logs  # Also search logs for settled signals
 """
 
 import os
+import re
 import sys
+import mmap
 import argparse
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 from colorama import Fore, Style, init
 
-init(autoreset=True)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import get_conn
+
+if sys.stdout.isatty():
+    init(autoreset=True)  # Consoles need the wrapper: autoreset after each write (+ ANSI translation on Windows)
+else:
+    # Redirected output (pipes, grep, tee, CI) gets no colour codes and no per-write wrapper
+    class _NoColour:
+        def __getattr__(self, name):
+            return ''
+
+    Fore = Style = _NoColour()
+
+# Colour prefixes and fixed strings, built once instead of per printed line
+HEADER_BAR = f"{Style.BRIGHT}{'=' * 80}"
+TITLE = f"{Fore.CYAN}{Style.BRIGHT}"
+SECTION_RULE = f"{Style.DIM}{'─' * 81}"
+DETAIL = f"{Style.DIM}{' ' * 21}"       # Indent under a timeline timestamp
+TIME_FMT = '%H:%M:%S.%f'
+
+# Only the newest part of each log is searched by default; traced signals are recent
+LOG_TAIL_BYTES = 8 * 1024 * 1024
+
+# Log lines collected per signal (newest first, then shown in file order); the scan stops there
+PARSER_MAX_MATCHES = 3
+FLEET_MAX_MATCHES = 10
+SEARCH_BLOCK_BYTES = 1024 * 1024  # Step size when scanning a log window backwards
 
 
 class SignalTracer:
-    def __init__(self):
+    def __init__(self, log_tail_bytes=LOG_TAIL_BYTES, scan_logs=False):
+        self.log_tail_bytes = log_tail_bytes  # 0 = search whole logs
+        self.scan_logs = scan_logs            # Search logs even for settled signals
         self.db_path = "/Users/johnny_main/Developer/data/signals/signals.db"
         self.fleet_log = "/Users/johnny_main/Developer/data/logs/fleet_launchd.err"
         self.parser_log = "/Users/johnny_main/Developer/data/logs/telegram_signals_sqlite.log"
+        self._index_ready = False
+        # log_file -> (size, mtime_ns, max_bytes, mm, lo): mapped windows reused until the file changes
+        self._log_maps = {}
+
+    def _cursor(self):
+        """Cursor on the shared connection (db.get_conn), yielding sqlite3.Row.
+        The first call also tries to create the index the related-exit lookup filters and orders by."""
+        conn = get_conn(self.db_path)
+        if not self._index_ready:
+            self._index_ready = True  # One attempt per run, whether or not it succeeds
+            try:
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_signals_symbol_bot_created ON signals(symbol, bot_name, created_at)")
+                conn.commit()
+            except sqlite3.Error as e:
+                # Read-only or locked database: the lookups still work, just without the index
+                conn.rollback()
+                print(f"{Fore.YELLOW}⚠️  Could not create idx_signals_symbol_bot_created: {e}")
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row  # Per cursor, so the shared connection is left as is
+        return cursor
 
     def get_signal_from_db(self, signal_id=None, symbol=None, bot_name=None, limit=5):
         """Retrieve signal(s) from database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = self._cursor()
 
             if signal_id:
                 query = "SELECT * FROM signals WHERE id = ?"
                 cursor.execute(query, (signal_id,))
                 result = cursor.fetchone()
-                conn.close()
                 return [dict(result)] if result else []
 
             elif symbol:
@@ -79,42 +128,234 @@ class SignalTracer:
                 cursor.execute(query, (limit,))
 
             results = cursor.fetchall()
-            conn.close()
             return [dict(row) for row in results]
 
         except Exception as e:
             print(f"{Fore.RED}Database error: {e}")
             return []
 
-    def search_logs(self, log_file, search_terms, context_lines=3):
+    def _map_log(self, log_file, max_bytes):
+        """Memory-map the last max_bytes of log_file (0 = all); returns (mm, lo) where lo is the
+        first full line in the window, or None for an empty file. Cached per file until its size
+        or mtime changes, so repeated searches in one run don't re-open and re-map it."""
+        st = os.stat(log_file)
+        cached = self._log_maps.get(log_file)
+        if cached and cached[:3] == (st.st_size, st.st_mtime_ns, max_bytes):
+            return cached[3:]
+        if cached:
+            cached[3].close()
+            del self._log_maps[log_file]
+        if st.st_size == 0:
+            return None  # mmap refuses empty files
+
+        with open(log_file, 'rb') as f:
+            # mmap offsets must be aligned to the allocation granularity
+            window_start = max(0, st.st_size - max_bytes) if max_bytes else 0
+            offset = window_start - window_start % mmap.ALLOCATIONGRANULARITY
+            mm = mmap.mmap(f.fileno(), st.st_size - offset, access=mmap.ACCESS_READ, offset=offset)
+
+        lo = window_start - offset
+        if window_start > 0 and mm[lo - 1:lo] != b'\n':
+            # Drop the partial line the window starts in
+            nxt = mm.find(b'\n', lo)
+            lo = len(mm) if nxt == -1 else nxt + 1
+        self._log_maps[log_file] = (st.st_size, st.st_mtime_ns, max_bytes, mm, lo)
+        return mm, lo
+
+    def search_logs(self, log_file, search_terms, context_lines=3, max_bytes=None, max_matches=None):
         """Search log file for specific terms and return matches with context"""
-        if not Path(log_file).exists():
-            return []
+        return self.search_logs_multi(log_file, {None: search_terms}, context_lines, max_bytes, max_matches)[None]
+
+    def search_logs_multi(self, log_file, terms_by_key, context_lines=3, max_bytes=None, max_matches=None):
+        """Search log file for several term lists in one pass; returns {key: matches}.
 
-        matches = []
+        The file is memory-mapped and scanned with one case-insensitive pattern built from
+        all terms, so only matching lines (and their context) are sliced out and decoded.
+        Only the last max_bytes (default: self.log_tail_bytes, 0 = whole file) are mapped,
+        starting at the first full line; line_num then counts from the start of that window.
+
+        With max_matches, the window is scanned newest-first and stops once every key has
+        its last max_matches lines (returned in file order). line_num then counts back from
+        the end of the window instead (-1 = last line), so the start is never read.
+        """
+        results = {key: [] for key in terms_by_key}
+        if not Path(log_file).exists():
+            return results
+        if max_bytes is None:
+            max_bytes = self.log_tail_bytes
+
+        # One case-insensitive alternation over every distinct term, compiled once per search.
+        # bytes.lower() folds ASCII only, the same folding re.IGNORECASE applies to bytes patterns.
+        keys_by_term = {}
+        for key, terms in terms_by_key.items():
+            for term in terms:
+                keys_by_term.setdefault(term.encode().lower(), set()).add(key)
+        pattern = re.compile(b'|'.join(re.escape(term) for term in sorted(keys_by_term)), re.IGNORECASE)
         try:
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-
-            for i, line in enumerate(lines):
-                if any(term.lower() in line.lower() for term in search_terms):
-                    # Get context lines
-                    start = max(0, i - context_lines)
-                    end = min(len(lines), i + context_lines + 1)
-                    context = ''.join(lines[start:end])
-                    matches.append({
-                        'line_num': i + 1,
-                        'line': line.strip(),
-                        'context': context
-                    })
+            window = self._map_log(log_file, max_bytes)
+            if window is None:
+                return results  # Empty file
+            mm, lo = window
+            size = len(mm)
+
+            if max_matches is None:
+                hits = self._matching_lines(mm, lo, pattern)
+            else:
+                hits = self._matching_lines_reversed(mm, lo, pattern)
+
+            open_keys = set(results)  # Keys still below max_matches
+            for start, end, line_num in hits:
+                if len(results) == 1:
+                    keys = open_keys
+                else:
+                    # Which signals this line belongs to: each distinct term is checked once
+                    line_lower = mm[start:end].lower()
+                    keys = set()
+                    for term, term_keys in keys_by_term.items():
+                        if term in line_lower:
+                            keys |= term_keys
+                    keys &= open_keys
+                if not keys:
+                    continue
+
+                # Get context lines
+                ctx_start = start
+                for _ in range(context_lines):
+                    if ctx_start <= lo:
+                        break
+                    ctx_start = max(lo, mm.rfind(b'\n', 0, ctx_start - 1) + 1)
+                ctx_end = end
+                for _ in range(context_lines):
+                    if ctx_end >= size:
+                        break
+                    nxt = mm.find(b'\n', ctx_end)
+                    ctx_end = size if nxt == -1 else nxt + 1
+
+                match = {
+                    'line_num': line_num,
+                    'line': mm[start:end].decode('utf-8', errors='replace').strip(),
+                    'context': mm[ctx_start:ctx_end].decode('utf-8', errors='replace')
+                }
+                for key in list(keys):
+                    results[key].append(match)
+                    if max_matches is not None and len(results[key]) >= max_matches:
+                        open_keys.discard(key)
+                if not open_keys:
+                    break
+
+            if max_matches is not None:
+                for bucket in results.values():
+                    bucket.reverse()  # Collected newest-first
 
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not read {log_file}: {e}")
 
-        return matches
-
-    def trace_signal(self, signal):
-        """Trace a single signal through the pipeline"""
+        return results
+
+    @staticmethod
+    def _matching_lines(mm, lo, pattern):
+        """Yield (start, end, line_num) for each line in mm[lo:] matching pattern, first to last.
+        end includes the newline; line_num is 1-based from lo."""
+        size = len(mm)
+        line_num = 1      # Line number at counted_to
+        counted_to = lo
+        pos = lo
+        while pos < size:
+            m = pattern.search(mm, pos)
+            if not m:
+                break
+
+            # Bounds of the matching line, newline included
+            start = max(lo, mm.rfind(b'\n', 0, m.start()) + 1)
+            end = mm.find(b'\n', m.end())
+            end = size if end == -1 else end + 1
+
+            line_num += mm[counted_to:start].count(b'\n')
+            counted_to = start
+            yield start, end, line_num
+            pos = end  # One entry per line, however many terms it matches
+
+    @staticmethod
+    def _matching_lines_reversed(mm, lo, pattern):
+        """Yield (start, end, line_num) for each line in mm[lo:] matching pattern, last to first.
+        Scans whole-line blocks of SEARCH_BLOCK_BYTES backwards; line_num is -1 for the last line."""
+        size = len(mm)
+        # Lines from hi to the end; an unterminated last line counts too
+        lines_after = 1 if mm[size - 1:size] != b'\n' else 0
+        hi = size
+        while hi > lo:
+            block_lo = max(lo, hi - SEARCH_BLOCK_BYTES)
+            if block_lo > lo:
+                block_lo = max(lo, mm.rfind(b'\n', lo, block_lo) + 1)  # Back to a line start
+
+            block_hits = []
+            pos = block_lo
+            while pos < hi:
+                m = pattern.search(mm, pos, hi)
+                if not m:
+                    break
+                start = max(block_lo, mm.rfind(b'\n', 0, m.start()) + 1)
+                end = mm.find(b'\n', m.end(), hi)
+                end = hi if end == -1 else end + 1
+                block_hits.append((start, end))
+                pos = end
+
+            for start, end in reversed(block_hits):
+                yield start, end, -(mm[start:hi].count(b'\n') + lines_after)
+
+            lines_after += mm[block_lo:hi].count(b'\n')
+            hi = block_lo
+
+    def _needs_log_scan(self, signal):
+        """Logs are searched for pending/failed signals, or for all with --scan-logs"""
+        return self.scan_logs or signal['status'] in ('pending', 'failed')
+
+    @staticmethod
+    def _parser_terms(signal):
+        return [signal['symbol'], f"ID: {signal['id']}"]
+
+    @staticmethod
+    def _fleet_terms(signal):
+        return [signal['symbol'], f"Signal {signal['id']}", f"signal_id={signal['id']}"]
+
+    def get_related_exits(self, signals):
+        """First exit after each entry signal (same symbol and bot), in one query.
+        Returns {entry_id: exit row or None}, or None if the lookup failed."""
+        entries = [s for s in signals if s['signal_type'] == 'entry']
+        if not entries:
+            return {}
+        try:
+            cursor = self._cursor()
+            needles = ", ".join("(?, ?, ?, ?)" for _ in entries)
+            params = [v for s in entries for v in (s['id'], s['symbol'], s['bot_name'], s['created_at'])]
+            # created_at is ISO-8601 text, which sorts chronologically, so "s.created_at > n.created_at"
+            # is a range scan on idx_signals_symbol_bot_created as is; no epoch column is needed.
+            # Ties on created_at resolve by id, as the per-signal LIMIT 1 walked the index in rowid order
+            cursor.execute(f"""
+                WITH needles(entry_id, symbol, bot_name, created_at) AS (VALUES {needles})
+                SELECT entry_id, id, created_at FROM (
+                    SELECT n.entry_id, s.id, s.created_at,
+                           ROW_NUMBER() OVER (PARTITION BY n.entry_id ORDER BY s.created_at, s.id) AS rn
+                    FROM needles n
+                    JOIN signals s
+                      ON s.symbol = n.symbol
+                     AND s.bot_name = n.bot_name
+                     AND s.signal_type = 'exit'
+                     AND s.created_at > n.created_at
+                )
+                WHERE rn = 1
+            """, params)
+            exits = {s['id']: None for s in entries}
+            for row in cursor.fetchall():
+                exits[row['entry_id']] = row
+            return exits
+        except Exception:
+            return None
+
+    def trace_signal(self, signal, log_matches=None, related_exits=None):
+        """Trace a single signal through the pipeline.
+        log_matches: optional (parser_matches, fleet_matches) already collected by trace_all
+        related_exits: optional get_related_exits() result, so the exit lookup isn't re-queried"""
         signal_id = signal['id']
         symbol = signal['symbol']
         signal_type = signal['signal_type']
@@ -122,83 +363,80 @@ class SignalTracer:
         created_at = signal['created_at']
         bot_name = signal['bot_name']
 
-        print(f"\n{Style.BRIGHT}{'='*80}")
-        print(f"{Fore.CYAN}{Style.BRIGHT}SIGNAL TRACE: ID {signal_id} - {symbol} {signal_type.upper()}")
-        print(f"{Style.BRIGHT}{'='*80}\n")
-
-        # Timeline header
-        print(f"{Style.BRIGHT}TIMELINE:")
-        print(f"{Style.DIM}─────────────────────────────────────────────────────────────────────────────────\n")
+        # Header + timeline header as one write. autoreset only fires per write, so each
+        # line ends in RESET_ALL itself to keep its colour from bleeding into the next.
+        reset = Style.RESET_ALL
+        print(f"\n{HEADER_BAR}{reset}\n"
+              f"{TITLE}SIGNAL TRACE: ID {signal_id} - {symbol} {signal_type.upper()}{reset}\n"
+              f"{HEADER_BAR}\n{reset}\n"
+              f"{Style.BRIGHT}TIMELINE:{reset}\n"
+              f"{SECTION_RULE}\n")
 
         # Step 1: Database record
         created_time = datetime.fromisoformat(created_at)
-        print(f"{Fore.CYAN}{created_time.strftime('%H:%M:%S.%f')[:-3]} ⟶ DATABASE: Signal ID {signal_id} inserted")
-        print(f"{Style.DIM}                     Status: {status}")
-        print(f"{Style.DIM}                     Bot: {bot_name}")
-        print(f"{Style.DIM}                     Type: {signal_type}")
-
+        details = [f"Status: {status}", f"Bot: {bot_name}", f"Type: {signal_type}"]
         if signal_type == 'entry':
-            entry_price = signal.get('entry_1')
-            stop_loss = signal.get('stop_loss')
-            target = signal.get('target_1')
-            direction = signal.get('direction', 'N/A')
-            print(f"{Style.DIM}                     Direction: {direction}")
-            print(f"{Style.DIM}                     Entry: {entry_price}")
-            print(f"{Style.DIM}                     Stop: {stop_loss}")
-            print(f"{Style.DIM}                     Target: {target}")
+            details += [
+                f"Direction: {signal.get('direction', 'N/A')}",
+                f"Entry: {signal.get('entry_1')}",
+                f"Stop: {signal.get('stop_loss')}",
+                f"Target: {signal.get('target_1')}",
+            ]
         else:
-            exit_price = signal.get('target_1')
-            pnl = signal.get('notes', '')
-            print(f"{Style.DIM}                     Exit Price: {exit_price}")
-            print(f"{Style.DIM}                     Notes: {pnl}")
-
-        print()
-
-        # Step 2: Parser logs
-        parser_matches = self.search_logs(
-            self.parser_log,
-            [symbol, f"ID: {signal_id}"],
-            context_lines=2
-        )
-
-        if parser_matches:
-            for match in parser_matches[:3]:  # Show first 3 matches
-                print(f"{Fore.GREEN}XX:XX:XX.XXX ⟶ PARSER: {match['line']}")
-            print()
-        else:
-            print(f"{Fore.YELLOW}XX:XX:XX.XXX ⟶ PARSER: No specific log entries found")
-            print(f"{Style.DIM}                     (Parser may have logged to aggregation channel activity)")
-            print()
-
-        # Step 3: Fleet execution logs
-        fleet_matches = self.search_logs(
-            self.fleet_log,
-            [symbol, f"Signal {signal_id}", f"signal_id={signal_id}"],
-            context_lines=5
-        )
-
-        if fleet_matches:
-            for match in fleet_matches:
-                line = match['line']
-                if 'SUCCESS' in line or '✅' in line:
-                    print(f"{Fore.GREEN}XX:XX:XX.XXX ⟶ FLEET: {line}")
-                elif 'ERROR' in line or '❌' in line or 'FAILED' in line:
-                    print(f"{Fore.RED}XX:XX:XX.XXX ⟶ FLEET: {line}")
-                else:
-                    print(f"{Fore.BLUE}XX:XX:XX.XXX ⟶ FLEET: {line}")
+            details += [
+                f"Exit Price: {signal.get('target_1')}",
+                f"Notes: {signal.get('notes', '')}",
+            ]
+        print(f"{Fore.CYAN}{created_time.strftime(TIME_FMT)[:-3]} ⟶ DATABASE: Signal ID {signal_id} inserted{reset}\n"
+              + "".join(f"{DETAIL}{detail}{reset}\n" for detail in details))
+
+        # Steps 2-3: logs. Skipped by default for settled signals, where the status already
+        # tells the story and the log scans are the slowest part of a trace.
+        if not self._needs_log_scan(signal):
+            print(f"{Style.DIM}XX:XX:XX.XXX ⟶ LOGS: Not searched for '{status}' signals (use --scan-logs)")
             print()
         else:
-            if status in ['pending', 'failed']:
-                print(f"{Fore.RED}XX:XX:XX.XXX ⟶ FLEET: Signal not processed (status: {status})")
-                print(f"{Style.DIM}                     Check if fleet_runner is running")
-                print(f"{Style.DIM}                     Check bot_id matches in FLEET_CONFIG")
+            # Step 2: Parser logs
+            if log_matches is not None:
+                parser_matches, fleet_matches = log_matches
             else:
-                print(f"{Fore.YELLOW}XX:XX:XX.XXX ⟶ FLEET: No log entries found, but status is '{status}'")
-            print()
+                parser_matches = self.search_logs(self.parser_log, self._parser_terms(signal), context_lines=2,
+                                                  max_matches=PARSER_MAX_MATCHES)
+                fleet_matches = self.search_logs(self.fleet_log, self._fleet_terms(signal), context_lines=5,
+                                                 max_matches=FLEET_MAX_MATCHES)
+
+            if parser_matches:
+                for match in parser_matches[:3]:  # Show first 3 matches
+                    print(f"{Fore.GREEN}XX:XX:XX.XXX ⟶ PARSER: {match['line']}")
+                print()
+            else:
+                print(f"{Fore.YELLOW}XX:XX:XX.XXX ⟶ PARSER: No specific log entries found")
+                print(f"{DETAIL}(Parser may have logged to aggregation channel activity)")
+                print()
+
+            # Step 3: Fleet execution logs
+            if fleet_matches:
+                for match in fleet_matches:
+                    line = match['line']
+                    if 'SUCCESS' in line or '✅' in line:
+                        print(f"{Fore.GREEN}XX:XX:XX.XXX ⟶ FLEET: {line}")
+                    elif 'ERROR' in line or '❌' in line or 'FAILED' in line:
+                        print(f"{Fore.RED}XX:XX:XX.XXX ⟶ FLEET: {line}")
+                    else:
+                        print(f"{Fore.BLUE}XX:XX:XX.XXX ⟶ FLEET: {line}")
+                print()
+            else:
+                if status in ['pending', 'failed']:
+                    print(f"{Fore.RED}XX:XX:XX.XXX ⟶ FLEET: Signal not processed (status: {status})")
+                    print(f"{DETAIL}Check if fleet_runner is running")
+                    print(f"{DETAIL}Check bot_id matches in FLEET_CONFIG")
+                else:
+                    print(f"{Fore.YELLOW}XX:XX:XX.XXX ⟶ FLEET: No log entries found, but status is '{status}'")
+                print()
 
         # Step 4: Analysis
         print(f"{Style.BRIGHT}ANALYSIS:")
-        print(f"{Style.DIM}─────────────────────────────────────────────────────────────────────────────────\n")
+        print(f"{SECTION_RULE}\n")
 
         if status == 'filled' or status == 'executed':
             print(f"{Fore.GREEN}✅ Signal successfully processed")
@@ -223,20 +461,20 @@ class SignalTracer:
         if signal_type == 'entry':
             # Look for corresponding exit
             try:
-                conn = sqlite3.connect(self.db_path)
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM signals
-                    WHERE symbol = ?
-                    AND bot_name = ?
-                    AND signal_type = 'exit'
-                    AND created_at > ?
-                    ORDER BY created_at ASC
-                    LIMIT 1
-                """, (symbol, bot_name, created_at))
-                exit_signal = cursor.fetchone()
-                conn.close()
+                if related_exits is not None:
+                    exit_signal = related_exits.get(signal_id)
+                else:
+                    cursor = self._cursor()
+                    cursor.execute("""
+                        SELECT * FROM signals
+                        WHERE symbol = ?
+                        AND bot_name = ?
+                        AND signal_type = 'exit'
+                        AND created_at > ?
+                        ORDER BY created_at ASC
+                        LIMIT 1
+                    """, (symbol, bot_name, created_at))
+                    exit_signal = cursor.fetchone()
 
                 if exit_signal:
                     exit_id = exit_signal['id']
@@ -252,10 +490,24 @@ class SignalTracer:
 
     def trace_all(self, signals):
         """Trace multiple signals"""
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}TRACING {len(signals)} SIGNALS")
+        print(f"\n{TITLE}TRACING {len(signals)} SIGNALS")
+
+        # One pass per log for all signals' terms, instead of two scans per signal
+        scanned = [s for s in signals if self._needs_log_scan(s)]
+        parser_hits, fleet_hits = {}, {}
+        if scanned:
+            parser_hits = self.search_logs_multi(
+                self.parser_log, {s['id']: self._parser_terms(s) for s in scanned}, context_lines=2,
+                max_matches=PARSER_MAX_MATCHES)
+            fleet_hits = self.search_logs_multi(
+                self.fleet_log, {s['id']: self._fleet_terms(s) for s in scanned}, context_lines=5,
+                max_matches=FLEET_MAX_MATCHES)
+        # Likewise one query for every entry's related exit
+        related_exits = self.get_related_exits(signals)
 
         for i, signal in enumerate(signals):
-            self.trace_signal(signal)
+            log_matches = (parser_hits.get(signal['id'], []), fleet_hits.get(signal['id'], []))
+            self.trace_signal(signal, log_matches, related_exits)
             if i < len(signals) - 1:
                 print(f"\n{Style.DIM}{'─'*80}\n")
 
@@ -267,10 +519,14 @@ def main():
     parser.add_argument('--bot', help='Trace signals for specific bot (Alpha, Sentient, Apprentice)')
     parser.add_argument('--recent', type=int, default=5, help='Number of recent signals to show (default: 5)')
     parser.add_argument('--all', action='store_true', help='Show all recent signals')
+    parser.add_argument('--scan-logs', action='store_true',
+                        help='Search parser/fleet logs for every signal, not only pending/failed ones')
+    parser.add_argument('--log-tail-mb', type=int, default=LOG_TAIL_BYTES // (1024 * 1024),
+                        help='Search only the last N MiB of each log, 0 for the whole file (default: %(default)s)')
 
     args = parser.parse_args()
 
-    tracer = SignalTracer()
+    tracer = SignalTracer(log_tail_bytes=args.log_tail_mb * 1024 * 1024, scan_logs=args.scan_logs)
 
     if args.signal_id:
         signals = tracer.get_signal_from_db(signal_id=args.signal_id)